@@ -17,16 +17,33 @@ Examples:
   %(prog)s gui              Launch graphical interface
   %(prog)s cli              Launch command-line interface
   %(prog)s test             Run test suite
+  %(prog)s encrypt --key KEY --in plain.txt --out cipher.txt
+                            Encrypt a file (stdin/stdout by default)
+  %(prog)s decrypt --key KEY --workers 4 < cipher.txt
+                            Decrypt a stream in parallel
+  %(prog)s rotate DIR --old-key OLD --new-key NEW
+                            Re-key every ciphertext file under DIR
+  %(prog)s batch --in jobs.jsonl --out results.jsonl
+                            Process JSONL {id, key, op, text} records
         """
     )
     
-    parser.add_argument(
-        'mode',
-        choices=['gui', 'cli', 'test'],
-        help='Operating mode: gui (graphical), cli (command-line), or test'
-    )
+    subparsers = parser.add_subparsers(dest='mode', required=True, metavar='mode',
+                                       help='Operating mode')
+    subparsers.add_parser('gui', help='Launch graphical interface')
+    subparsers.add_parser('cli', help='Launch command-line interface')
+    subparsers.add_parser('test', help='Run test suite')
+    # Options of these modes are added in their branches below, so that each
+    # mode imports only its own machinery
+    subparsers.add_parser('encrypt', help='Encrypt a file or stdin', add_help=False)
+    subparsers.add_parser('decrypt', help='Decrypt a file or stdin', add_help=False)
+    subparsers.add_parser('rotate', help='Re-key a directory of ciphertext files', add_help=False)
+    subparsers.add_parser('batch', help='Process a JSON Lines file of jobs', add_help=False)
     
-    args = parser.parse_args()
+    args, extra = parser.parse_known_args()
+    if extra and args.mode in ('gui', 'cli', 'test'):
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    options = argparse.ArgumentParser(prog=f'{parser.prog} {args.mode}')
     
     if args.mode == 'gui':
         from src.gui.app import launch
@@ -40,6 +57,24 @@ Examples:
         from tests.test_cipher import run_tests
         success = run_tests()
         sys.exit(0 if success else 1)
+    
+    elif args.mode in ('encrypt', 'decrypt'):
+        from src.cipher import PlayFairCipher
+        from src.cli.pipe import add_arguments, run
+        add_arguments(options, workers=args.mode == 'decrypt')
+        sys.exit(run(PlayFairCipher, options.parse_args(extra), args.mode))
+    
+    elif args.mode == 'rotate':
+        from src.cipher import PlayFairCipher
+        from src.cli.rotate import add_arguments, run_rotation
+        add_arguments(options)
+        sys.exit(run_rotation(PlayFairCipher, options.parse_args(extra)))
+    
+    elif args.mode == 'batch':
+        from src.cipher import PlayFairCipher
+        from src.cli.jsonl import add_arguments, run_batch
+        add_arguments(options)
+        sys.exit(run_batch(PlayFairCipher, options.parse_args(extra)))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,162 @@
+"""
+PlayFair Cipher Batch Processing
+Encrypts or decrypts many short messages under many keys. Messages are
+grouped by key so each cipher is built once, and every group is prepared
+message by message but transformed as one joined text. One message can also
+be fanned out to many keys, preparing it only once.
+"""
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, chain, islice, repeat
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from . import vectorized
+
+
+# Most keys handled together on the NumPy fan-out path
+FAN_OUT_BLOCK = 1024
+
+# Most output codes held in memory per fan-out block
+FAN_OUT_BUDGET = 1 << 24
+
+
+def transform_group(cipher, texts: Sequence[str], mode: str = 'encrypt') -> List[str]:
+    """
+    Encrypt or decrypt many texts under one cipher.
+    
+    Every prepared text has even length, so the joined text can be mapped
+    through the digraph tables in a single call and cut back into messages.
+    
+    Args:
+        cipher: PlayFairEngine instance (e.g. PlayFairCipher)
+        texts: Messages to process
+        mode: 'encrypt' or 'decrypt'
+    
+    Returns:
+        One result per text, equal to cipher.encrypt(text) / cipher.decrypt(text)
+    """
+    if mode == 'encrypt':
+        prepared = list(map(cipher._prepare, texts))
+    else:
+        prepared = [text[:len(text) - len(text) % 2] for text in map(cipher._clean, texts)]
+    
+    output = cipher._apply_tables(''.join(prepared), mode=mode)
+    ends = list(accumulate(map(len, prepared)))
+    return [output[start:end] for start, end in zip([0] + ends, ends)]
+
+
+def _run_group(cipher_class, key: str, texts: List[str], mode: str) -> List[str]:
+    """Build the cipher for one key group and process it (also used by workers)."""
+    return transform_group(cipher_class(key), texts, mode=mode)
+
+
+def process_many(cipher_class, items: Iterable, mode: str = 'encrypt',
+                 key: Optional[str] = None, workers: Optional[int] = None) -> List[str]:
+    """
+    Encrypt or decrypt many messages, grouping them by key.
+    
+    Args:
+        cipher_class: PlayFairEngine subclass (e.g. PlayFairCipher)
+        items: (key, text) pairs, or plain texts when key is given
+        mode: 'encrypt' or 'decrypt'
+        key: Keyword shared by every item
+        workers: Spread key groups over this many processes (default: none)
+    
+    Returns:
+        Results in input order
+    
+    Raises:
+        ValueError: If any key is invalid
+    """
+    if key is not None:
+        items = zip(repeat(key), items)
+    
+    groups: Dict[str, List[int]] = {}
+    texts = []
+    for index, (item_key, text) in enumerate(items):
+        groups.setdefault(item_key, []).append(index)
+        texts.append(text)
+    
+    keys = list(groups)
+    batches = [[texts[index] for index in groups[item_key]] for item_key in keys]
+    
+    if workers and workers > 1 and len(keys) > 1:
+        chunksize = max(1, len(keys) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outputs = list(pool.map(_run_group, repeat(cipher_class), keys, batches,
+                                    repeat(mode), chunksize=chunksize))
+    else:
+        outputs = list(map(_run_group, repeat(cipher_class), keys, batches, repeat(mode)))
+    
+    results = [''] * len(texts)
+    for item_key, output in zip(keys, outputs):
+        for index, result in zip(groups[item_key], output):
+            results[index] = result
+    return results
+
+
+def fan_out(cipher_class, text: str, keys: Iterable[str], mode: str = 'encrypt') -> Iterator[str]:
+    """
+    Encrypt or decrypt one text under many keys.
+    
+    Cleaning and pairing do not depend on the key, so the text is prepared
+    once into codes. Per key only the distinct digraphs of the text are looked
+    up, without building the key's full digraph tables. With NumPy, blocks of
+    keys are processed together (see vectorized.FanOut).
+    
+    Args:
+        cipher_class: PlayFairEngine subclass (e.g. PlayFairCipher)
+        text: Message to process
+        keys: Keywords, consumed lazily
+        mode: 'encrypt' or 'decrypt'
+    
+    Yields:
+        One result per key, equal to cipher_class(key).encrypt(text) / .decrypt(text)
+    """
+    keys = iter(keys)
+    first = next(keys, None)
+    if first is None:
+        return
+    
+    cipher = cipher_class(first)
+    if mode == 'encrypt':
+        prepared = cipher._prepare(text)
+    else:
+        prepared = cipher._clean(text)
+        prepared = prepared[:len(prepared) - len(prepared) % 2]
+    
+    codes = cipher._codec.encode(prepared)
+    ciphers = chain([cipher], map(cipher_class, keys))
+    if vectorized.np is not None:
+        yield from _fan_out_vectorized(cipher_class, ciphers, codes, mode)
+    else:
+        yield from _fan_out_python(ciphers, codes, mode)
+
+
+def _fan_out_python(ciphers: Iterator, codes: bytes, mode: str) -> Iterator[str]:
+    """Apply the rules to the text's distinct digraphs, one key at a time."""
+    shift = 1 if mode == 'encrypt' else -1
+    view = memoryview(codes).cast('H')
+    digraphs = set(view)
+    for cipher in ciphers:
+        codec = cipher._codec
+        lookup = {digraph: codec.join(*cipher._code_rule(*codec.split(digraph), shift))
+                  for digraph in digraphs}
+        yield codec.decode(array('H', map(lookup.__getitem__, view)).tobytes())
+
+
+def _fan_out_vectorized(cipher_class, ciphers: Iterator, codes: bytes, mode: str) -> Iterator[str]:
+    """Apply the rules to stacked flat matrices, one block of keys at a time."""
+    codec = cipher_class._codec
+    kernel = vectorized.FanOut(codes, cipher_class.SIZE)
+    block = max(1, min(FAN_OUT_BLOCK, FAN_OUT_BUDGET // max(len(codes), 1)))
+    while True:
+        chunk = list(islice(ciphers, block))
+        if not chunk:
+            return
+        
+        cells = b''.join(cipher._cells for cipher in chunk)
+        positions = b''.join(cipher._positions for cipher in chunk)
+        for row in kernel.apply(cells, positions, mode=mode):
+            yield codec.decode(row.tobytes())
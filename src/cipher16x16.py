@@ -0,0 +1,196 @@
+"""
+PlayFair Cipher 16x16 Implementation
+Binary-safe PlayFair cipher over a 16x16 matrix of all 256 byte values.
+Works on bytes-like objects, so any payload (UTF-8, JSON, compressed data)
+can be encrypted and recovered exactly.
+
+Duplicate bytes: a digraph of two equal bytes is encrypted with the same-row
+rule (both bytes shift right), which is invertible, so no filler is inserted
+and the data length is preserved.
+
+Padding: encrypt() always appends 0x80, followed by 0x00 if needed to reach
+an even length. decrypt() removes it again.
+"""
+
+from array import array
+from typing import Dict, List, Tuple, Union
+
+from . import vectorized
+from .codec import Codec
+from .engine import PlayFairEngine
+from .schedule import KeySchedule, schedule_cache
+
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+class PlayFairCipher16x16:
+    SIZE = 16
+    
+    # Byte values are their own codes
+    _codec = Codec(''.join(map(chr, range(256))))
+    
+    __slots__ = ('key', '_schedule')
+    
+    def __init__(self, key: Union[str, BytesLike]):
+        """
+        Initialize the 16x16 PlayFair cipher with a key.
+        
+        Args:
+            key: Key bytes, or text encoded as UTF-8
+        
+        Raises:
+            ValueError: If key is empty
+        """
+        if isinstance(key, str):
+            key = key.encode('utf-8')
+        key = bytes(key)
+        if not key:
+            raise ValueError("Key must not be empty")
+        
+        self.key = key
+        self._schedule = schedule_cache.get((type(self), self.key), self._build_schedule)
+    
+    def _build_schedule(self) -> KeySchedule:
+        """
+        Expand the key into its flat matrix and inverse index.
+        The digraph tables are added on first use (see _tables).
+        """
+        cells = self._generate_matrix()
+        positions = bytearray(256)
+        for cell, byte in enumerate(cells):
+            positions[byte] = cell
+        return KeySchedule(cells, bytes(positions))
+    
+    def _generate_matrix(self) -> bytes:
+        """
+        Generate the 16x16 matrix: unique key bytes, then the remaining byte values.
+        
+        Returns:
+            The 256 matrix bytes in row order
+        """
+        return bytes(dict.fromkeys(self.key + bytes(range(256))))
+    
+    @property
+    def _cells(self) -> bytes:
+        """Matrix bytes in row order."""
+        return self._schedule.cells
+    
+    @property
+    def _positions(self) -> bytes:
+        """Cell index (row * 16 + column) of every byte value."""
+        return self._schedule.positions
+    
+    @property
+    def matrix(self) -> Tuple[Tuple[int, ...], ...]:
+        """Read-only 16x16 view of the matrix, built on access."""
+        return tuple(map(tuple, self.get_matrix()))
+    
+    @property
+    def position_map(self) -> Dict[int, Tuple[int, int]]:
+        """Map each byte value to its (row, column) position, built on access."""
+        return {byte: divmod(cell, self.SIZE) for byte, cell in enumerate(self._positions)}
+    
+    # Same row / column / rectangle rules as the text ciphers, on byte values
+    _code_rule = PlayFairEngine._code_rule
+    
+    def _build_tables(self) -> Tuple[array, array]:
+        """
+        Precompute every ordered byte digraph (65,536 pairs).
+        
+        Returns:
+            Encrypt and decrypt tables indexed by table offset (see Codec)
+        """
+        encrypt_table = self._codec.table(lambda a, b: self._code_rule(a, b, 1))
+        decrypt_table = self._codec.table(lambda a, b: self._code_rule(a, b, -1))
+        return encrypt_table, decrypt_table
+    
+    def _tables(self) -> Tuple[array, array]:
+        """Return the encrypt and decrypt tables, building them on first use."""
+        schedule = self._schedule
+        if schedule.tables is None:
+            schedule.tables = self._build_tables()
+        return schedule.tables
+    
+    @property
+    def _encrypt_table(self) -> array:
+        """Digraph encrypt table, built on first use."""
+        return self._tables()[0]
+    
+    @property
+    def _decrypt_table(self) -> array:
+        """Digraph decrypt table, built on first use."""
+        return self._tables()[1]
+    
+    def get_matrix(self) -> List[List[int]]:
+        """Return a copy of the cipher matrix as a list of lists of byte values."""
+        cells = self._cells
+        return [list(cells[i:i + 16]) for i in range(0, 256, 16)]
+    
+    def print_matrix(self) -> None:
+        """Print the cipher matrix as hexadecimal byte values."""
+        print("\n16x16 PlayFair Cipher Matrix:")
+        print("─" * 51)
+        for row in self.get_matrix():
+            print("│ " + " ".join(f"{byte:02X}" for byte in row) + " │")
+        print("─" * 51)
+    
+    def _apply_rule(self, a: int, b: int, mode: str = 'encrypt') -> Tuple[int, int]:
+        """Apply the cipher to one digraph of byte values."""
+        codec = self._codec
+        table = self._encrypt_table if mode == 'encrypt' else self._decrypt_table
+        return codec.split(table[codec.offset(a, b)])
+    
+    def _transform(self, data: BytesLike, mode: str) -> bytes:
+        """
+        Map even-length data through the encrypt or decrypt table.
+        
+        Uses one NumPy gather when available, otherwise the codec's
+        pure-Python mapping.
+        """
+        view = memoryview(data).cast('B')
+        if len(view) % 2:
+            raise ValueError("Data length must be even")
+        
+        table = self._encrypt_table if mode == 'encrypt' else self._decrypt_table
+        if vectorized.np is not None:
+            return vectorized.apply_table(table, view, 256)
+        return self._codec.apply(table, view)
+    
+    def encrypt_block(self, data: BytesLike) -> bytes:
+        """
+        Encrypt even-length data without padding.
+        Use for all but the last block of a stream; finish with encrypt().
+        """
+        return self._transform(data, 'encrypt')
+    
+    def decrypt_block(self, data: BytesLike) -> bytes:
+        """Decrypt even-length data without removing padding."""
+        return self._transform(data, 'decrypt')
+    
+    def encrypt(self, data: BytesLike) -> bytes:
+        """
+        Encrypt binary data, appending the padding.
+        
+        Args:
+            data: Bytes-like payload
+        
+        Returns:
+            Ciphertext, one or two bytes longer than data
+        """
+        padding = b'\x80' if len(memoryview(data).cast('B')) % 2 else b'\x80\x00'
+        return self._transform(bytes(data) + padding, 'encrypt')
+    
+    def decrypt(self, data: BytesLike) -> bytes:
+        """
+        Decrypt ciphertext produced by encrypt() and remove the padding.
+        
+        Raises:
+            ValueError: If the length is odd or the padding is invalid
+        """
+        plaintext = self._transform(data, 'decrypt')
+        if plaintext[-1:] == b'\x80':
+            return plaintext[:-1]
+        if plaintext[-2:] == b'\x80\x00':
+            return plaintext[:-2]
+        raise ValueError("Invalid padding")
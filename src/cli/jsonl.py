@@ -0,0 +1,227 @@
+"""
+PlayFair Cipher - JSONL Batch Mode
+Processes JSON Lines jobs of {"id", "key", "op", "text"} records.
+
+Input is streamed in windows of records that are handed to a process pool.
+Within a window, records are grouped by key and operation so each group is
+processed in one pass under one cached schedule. Output is one JSON line per
+input record: {"id", "text"} on success, {"id", "line", "error"} otherwise.
+"""
+
+import json
+import os
+import sys
+import time
+from collections import deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from itertools import islice
+from typing import Callable, Iterable, List, Optional, Tuple, Union
+
+from ..batch import transform_group
+from .pipe import positive_int
+
+
+# Records per worker task
+WINDOW = 4096
+
+OPERATIONS = ('encrypt', 'decrypt')
+
+Entry = namedtuple('Entry', ['line', 'id', 'key', 'op', 'text', 'error'])
+BatchStats = namedtuple('BatchStats', ['records', 'failed', 'seconds'])
+
+
+def add_arguments(parser) -> None:
+    """Add the batch subcommand arguments to an argparse parser."""
+    parser.add_argument('--in', dest='input', default='-',
+                        help='JSONL input file (default: stdin)')
+    parser.add_argument('--out', dest='output', default='-',
+                        help='JSONL output file (default: stdout)')
+    parser.add_argument('--workers', type=positive_int, default=None,
+                        help='Worker processes (default: CPU count)')
+    parser.add_argument('--unordered', action='store_true',
+                        help='Write results as they complete instead of in input order')
+    parser.add_argument('--window', type=positive_int, default=WINDOW,
+                        help=f'Records per worker task (default: {WINDOW})')
+
+
+def parse_record(line_number: int, line: Union[bytes, str]) -> Entry:
+    """
+    Parse one JSONL record.
+    
+    Args:
+        line_number: 1-based line number, for error reports
+        line: Raw line; bytes are decoded as UTF-8
+    
+    Returns:
+        Entry whose error is set if the record is malformed
+    """
+    if isinstance(line, bytes):
+        try:
+            line = line.decode('utf-8')
+        except UnicodeDecodeError as e:
+            return Entry(line_number, None, None, None, None, f"invalid UTF-8: {e}")
+    try:
+        record = json.loads(line)
+    except (ValueError, RecursionError) as e:
+        # RecursionError: nesting too deep for the decoder
+        return Entry(line_number, None, None, None, None, f"invalid JSON: {e}")
+    if not isinstance(record, dict):
+        return Entry(line_number, None, None, None, None, "record must be an object")
+    
+    record_id = record.get('id')
+    key, op, text = record.get('key'), record.get('op'), record.get('text')
+    if not isinstance(key, str) or not isinstance(text, str):
+        error = "'key' and 'text' must be strings"
+    elif op not in OPERATIONS:
+        error = "'op' must be 'encrypt' or 'decrypt'"
+    else:
+        error = None
+    return Entry(line_number, record_id, key, op, text, error)
+
+
+def _format(entry: Entry, result: Optional[str], error: Optional[str]) -> str:
+    """Render the output line for one record."""
+    if error is not None:
+        return json.dumps({'id': entry.id, 'line': entry.line, 'error': error}) + "\n"
+    return json.dumps({'id': entry.id, 'text': result}) + "\n"
+
+
+def _process_window(cipher_class, lines: List[Tuple[int, Union[bytes, str]]]) -> Tuple[str, int]:
+    """
+    Process one window of numbered lines (run in a worker).
+    
+    Records are grouped by key and operation, so each group is transformed
+    in one pass under one schedule; keys seen before hit the schedule cache.
+    
+    Returns:
+        Output lines in input order, and the number of failed records
+    """
+    entries = [parse_record(number, line) for number, line in lines]
+    groups = {}
+    for index, entry in enumerate(entries):
+        if entry.error is None:
+            groups.setdefault((entry.key, entry.op), []).append(index)
+    
+    outputs = [None] * len(entries)
+    failed = 0
+    for index, entry in enumerate(entries):
+        if entry.error is not None:
+            outputs[index] = _format(entry, None, entry.error)
+            failed += 1
+    
+    for (key, op), indexes in groups.items():
+        try:
+            results = transform_group(cipher_class(key), [entries[i].text for i in indexes],
+                                      mode=op)
+            error = None
+        except ValueError as e:
+            results = [None] * len(indexes)
+            error = str(e)
+            failed += len(indexes)
+        for index, result in zip(indexes, results):
+            outputs[index] = _format(entries[index], result, error)
+    return ''.join(outputs), failed
+
+
+def process_jsonl(cipher_class, lines: Iterable[Union[bytes, str]], write: Callable[[str], object],
+                  workers: Optional[int] = None, ordered: bool = True,
+                  window: int = WINDOW) -> BatchStats:
+    """
+    Process a stream of JSONL records.
+    
+    Args:
+        cipher_class: PlayFairEngine subclass (e.g. PlayFairCipher)
+        lines: Input lines; bytes are decoded line by line, so a bad line
+            fails only its own record
+        write: Called with blocks of output lines
+        workers: Worker processes (default: CPU count; 1 runs in-process)
+        ordered: Write results in input order
+        window: Records per task (at least 1); at most two tasks per worker
+            are in flight
+    
+    Returns:
+        Number of records, number of failed records and elapsed seconds
+    
+    Raises:
+        ValueError: If window is less than 1
+    """
+    if window < 1:
+        raise ValueError("window must be at least 1")
+    start = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    numbered = ((number, line) for number, line in enumerate(lines, 1) if line.strip())
+    windows = iter(lambda: list(islice(numbered, window)), [])
+    
+    records = 0
+    failed = 0
+    
+    def collect(future) -> None:
+        nonlocal failed
+        output, errors = future.result()
+        failed += errors
+        write(output)
+    
+    if workers == 1:
+        for chunk in windows:
+            records += len(chunk)
+            output, errors = _process_window(cipher_class, chunk)
+            failed += errors
+            write(output)
+        return BatchStats(records, failed, time.perf_counter() - start)
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque()
+        for chunk in windows:
+            records += len(chunk)
+            in_flight.append(pool.submit(_process_window, cipher_class, chunk))
+            if len(in_flight) < 2 * workers:
+                continue
+            if ordered:
+                collect(in_flight.popleft())
+            else:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    in_flight.remove(future)
+                    collect(future)
+        
+        pending = in_flight if ordered else as_completed(in_flight)
+        for future in pending:
+            collect(future)
+    
+    return BatchStats(records, failed, time.perf_counter() - start)
+
+
+def run_batch(cipher_class, args) -> int:
+    """
+    Run the batch subcommand. Throughput is reported on stderr.
+    
+    Returns:
+        Process exit code (1 if any record failed)
+    """
+    try:
+        source = sys.stdin.buffer if args.input == '-' else open(args.input, 'rb')
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    try:
+        target = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    except OSError as e:
+        if source is not sys.stdin.buffer:
+            source.close()
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    
+    try:
+        stats = process_jsonl(cipher_class, source, target.write, workers=args.workers,
+                              ordered=not args.unordered, window=args.window)
+        target.flush()
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    
+    rate = stats.records / stats.seconds if stats.seconds > 0 else 0.0
+    print(f"Processed {stats.records} records ({stats.failed} failed) in "
+          f"{stats.seconds:.2f} s: {rate:.0f} records/s", file=sys.stderr)
+    return 1 if stats.failed else 0
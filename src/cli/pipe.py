@@ -0,0 +1,100 @@
+"""
+PlayFair Cipher - Pipeline Commands
+Non-interactive encrypt and decrypt subcommands for files and pipes.
+Input is read in fixed-size chunks and output goes through a buffered
+binary stream, so memory use stays constant for any input size.
+"""
+
+import argparse
+import os
+import sys
+
+from ..stream import READ_SIZE, read_text
+
+
+def positive_int(value: str) -> int:
+    """
+    argparse type for counts that must be at least 1.
+    
+    Raises:
+        argparse.ArgumentTypeError: If value is not a positive integer
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def add_arguments(parser, workers: bool = False) -> None:
+    """
+    Add the encrypt/decrypt subcommand arguments to an argparse parser.
+    
+    Args:
+        parser: Subcommand parser
+        workers: Also offer --workers (decrypt only)
+    """
+    parser.add_argument('--key', required=True, help='Cipher keyword')
+    parser.add_argument('--in', dest='input', default='-',
+                        help='Input file (default: stdin)')
+    parser.add_argument('--out', dest='output', default='-',
+                        help='Output file (default: stdout)')
+    parser.add_argument('--chunk-size', type=positive_int, default=READ_SIZE,
+                        help=f'Bytes read per step (default: {READ_SIZE})')
+    if workers:
+        parser.add_argument('--workers', type=positive_int, default=None,
+                            help='Decrypt chunks in this many processes')
+
+
+def run(cipher_class, args, mode: str) -> int:
+    """
+    Run the encrypt or decrypt subcommand.
+    
+    Args:
+        cipher_class: PlayFairEngine subclass (e.g. PlayFairCipher)
+        args: Parsed arguments (see add_arguments)
+        mode: 'encrypt' or 'decrypt'
+    
+    Returns:
+        Process exit code
+    """
+    try:
+        cipher = cipher_class(args.key)
+        source = sys.stdin.buffer if args.input == '-' else open(args.input, 'rb')
+    except (ValueError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    
+    try:
+        target = sys.stdout.buffer if args.output == '-' else open(args.output, 'wb')
+    except OSError as e:
+        if source is not sys.stdin.buffer:
+            source.close()
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    
+    try:
+        chunks = read_text(source, args.chunk_size)
+        if mode == 'encrypt':
+            pieces = cipher.iter_encrypt(chunks)
+        else:
+            pieces = cipher.iter_decrypt(chunks, workers=getattr(args, 'workers', None))
+        
+        for piece in pieces:
+            target.write(piece.encode('utf-8'))
+        if target.isatty():
+            target.write(b'\n')
+        target.flush()
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`); silence the flush at exit
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+        if target is not sys.stdout.buffer:
+            target.close()
+    return 0
@@ -0,0 +1,231 @@
+"""
+PlayFair Cipher - Key Rotation
+Re-keys every ciphertext file under a directory from an old key to a new one
+across a process pool.
+
+Each file is re-keyed into a temporary sibling, recorded in a progress
+journal and then renamed over the original. A killed run can be started
+again with the same arguments: journaled files are skipped (finishing any
+pending rename) and the rest are processed.
+"""
+
+import fnmatch
+import hashlib
+import os
+import shutil
+import statistics
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Set
+
+from ..rekey import Rekeyer
+from .pipe import positive_int
+
+
+JOURNAL_NAME = '.playfair-rotation.journal'
+TEMP_SUFFIX = '.rotating'
+
+FileResult = namedtuple('FileResult', ['path', 'size', 'seconds', 'error'])
+RotationSummary = namedtuple('RotationSummary', ['results', 'skipped', 'seconds', 'journal'])
+
+_worker_rekeyer = None
+
+
+def add_arguments(parser) -> None:
+    """Add the rotate subcommand arguments to an argparse parser."""
+    parser.add_argument('directory', help='Directory of ciphertext files (searched recursively)')
+    parser.add_argument('--old-key', required=True, help='Key the files are encrypted with')
+    parser.add_argument('--new-key', required=True, help='Key to re-encrypt the files with')
+    parser.add_argument('--workers', type=positive_int, default=None,
+                        help='Worker processes (default: CPU count)')
+    parser.add_argument('--pattern', default='*',
+                        help='Only rotate file names matching this glob (default: all)')
+    parser.add_argument('--journal', default=None,
+                        help=f'Progress journal (default: DIRECTORY/{JOURNAL_NAME})')
+    parser.add_argument('--verbose', action='store_true',
+                        help='List the throughput of every file')
+
+
+def _init_worker(cipher_class, old_key: str, new_key: str) -> None:
+    """Build the re-keying table once per worker process."""
+    global _worker_rekeyer
+    _worker_rekeyer = Rekeyer(cipher_class(old_key), cipher_class(new_key))
+
+
+def _rotate_file(path: str) -> FileResult:
+    """Re-key one file into its temporary sibling (run in a worker)."""
+    start = time.perf_counter()
+    temp = path + TEMP_SUFFIX
+    try:
+        size = os.path.getsize(path)
+        _worker_rekeyer.rekey_file(path, temp)
+        shutil.copymode(path, temp)
+        with open(temp, 'rb') as f:
+            os.fsync(f.fileno())
+    except OSError as e:
+        return FileResult(path, 0, time.perf_counter() - start, str(e))
+    return FileResult(path, size, time.perf_counter() - start, None)
+
+
+def _fingerprint(cipher_class, old_key: str, new_key: str) -> str:
+    """Identify a rotation without storing its keys."""
+    text = f"{cipher_class.__name__}\0{old_key}\0{new_key}"
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+def find_files(root: str, pattern: str = '*', exclude: Optional[str] = None) -> List[str]:
+    """
+    List the files to rotate, in a stable order.
+    
+    Returns:
+        Paths relative to root; temporary files and exclude are left out
+    """
+    files = []
+    for directory, subdirectories, names in os.walk(root):
+        subdirectories.sort()
+        for name in sorted(names):
+            path = os.path.join(directory, name)
+            if name.endswith(TEMP_SUFFIX) or not fnmatch.fnmatch(name, pattern):
+                continue
+            if exclude is not None and os.path.abspath(path) == os.path.abspath(exclude):
+                continue
+            files.append(os.path.relpath(path, root))
+    return files
+
+
+def _read_journal(journal: str, fingerprint: str) -> Set[str]:
+    """
+    Return the files already rotated according to the journal.
+    
+    Raises:
+        ValueError: If the journal belongs to a different rotation
+    """
+    if not os.path.exists(journal):
+        return set()
+    
+    with open(journal, encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    if lines[:1] and lines[0] != f"# rotation {fingerprint}":
+        raise ValueError(f"{journal} belongs to a different rotation; "
+                         "delete it to start a new one")
+    return set(lines[1:])
+
+
+def rotate_directory(cipher_class, root: str, old_key: str, new_key: str,
+                     workers: Optional[int] = None, pattern: str = '*',
+                     journal: Optional[str] = None) -> RotationSummary:
+    """
+    Re-key every matching file under root from old_key to new_key.
+    
+    Args:
+        cipher_class: PlayFairEngine subclass (e.g. PlayFairCipher)
+        root: Directory to walk
+        old_key: Key the files are encrypted with
+        new_key: Key to re-encrypt them with
+        workers: Worker processes (default: CPU count)
+        pattern: Glob for file names to include
+        journal: Progress journal path (default: inside root)
+    
+    Returns:
+        Per-file results, number of files skipped as already done, total
+        seconds and the journal path
+    
+    Raises:
+        ValueError: If root is not a directory, a key is invalid or the
+            journal is from another rotation
+        OSError: If the journal cannot be written or a rotated file cannot
+            be renamed into place
+    """
+    start = time.perf_counter()
+    if not os.path.isdir(root):
+        raise ValueError(f"Not a directory: {root}")
+    # Fail on an invalid key before any file is touched
+    cipher_class(old_key)
+    cipher_class(new_key)
+    
+    journal = journal or os.path.join(root, JOURNAL_NAME)
+    fingerprint = _fingerprint(cipher_class, old_key, new_key)
+    done = _read_journal(journal, fingerprint)
+    
+    pending = []
+    for name in find_files(root, pattern, exclude=journal):
+        path = os.path.join(root, name)
+        if name not in done:
+            pending.append(path)
+        elif os.path.exists(path + TEMP_SUFFIX):
+            # Journaled but killed before the rename
+            os.replace(path + TEMP_SUFFIX, path)
+    
+    results = []
+    new_journal = not os.path.exists(journal)
+    with open(journal, 'a', encoding='utf-8') as log:
+        if new_journal:
+            log.write(f"# rotation {fingerprint}\n")
+            log.flush()
+        
+        if pending:
+            workers = workers or os.cpu_count() or 1
+            chunksize = max(1, min(64, len(pending) // (workers * 4)))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(cipher_class, old_key, new_key)) as pool:
+                for result in pool.map(_rotate_file, pending, chunksize=chunksize):
+                    results.append(result)
+                    if result.error is not None:
+                        continue
+                    # Journal first: a journaled file is never re-keyed twice
+                    log.write(os.path.relpath(result.path, root) + "\n")
+                    log.flush()
+                    os.replace(result.path + TEMP_SUFFIX, result.path)
+    
+    return RotationSummary(results, len(done), time.perf_counter() - start, journal)
+
+
+def print_report(summary: RotationSummary, verbose: bool = False) -> None:
+    """Print per-file throughput and totals of a rotation."""
+    rotated = [result for result in summary.results if result.error is None]
+    failed = [result for result in summary.results if result.error is not None]
+    total = sum(result.size for result in rotated)
+    
+    def rate(size: int, seconds: float) -> float:
+        return size / (1 << 20) / seconds if seconds > 0 else 0.0
+    
+    if verbose:
+        for result in rotated:
+            print(f"  {result.path}: {result.size} bytes, "
+                  f"{rate(result.size, result.seconds):.1f} MB/s")
+    for result in failed:
+        print(f"  FAILED {result.path}: {result.error}", file=sys.stderr)
+    
+    print(f"\nRotated: {len(rotated)} files, {total} bytes")
+    print(f"Skipped (already rotated): {summary.skipped}")
+    print(f"Failed: {len(failed)}")
+    print(f"Elapsed: {summary.seconds:.2f} s "
+          f"({rate(total, summary.seconds):.1f} MB/s, "
+          f"{len(rotated) / summary.seconds if summary.seconds > 0 else 0:.1f} files/s)")
+    if rotated:
+        rates = [rate(result.size, result.seconds) for result in rotated]
+        slowest = max(rotated, key=lambda result: result.seconds)
+        print(f"Per file: median {statistics.median(rates):.1f} MB/s, "
+              f"slowest {slowest.path} ({slowest.seconds:.3f} s)")
+    print(f"Journal: {summary.journal}")
+
+
+def run_rotation(cipher_class, args) -> int:
+    """
+    Run the rotate subcommand.
+    
+    Returns:
+        Process exit code
+    """
+    try:
+        summary = rotate_directory(cipher_class, args.directory, args.old_key, args.new_key,
+                                   workers=args.workers, pattern=args.pattern,
+                                   journal=args.journal)
+    except (ValueError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    
+    print_report(summary, verbose=args.verbose)
+    return 1 if any(result.error is not None for result in summary.results) else 0
@@ -0,0 +1,118 @@
+"""
+PlayFair Integer Codec
+Converts cleaned text into compact alphabet index codes and back. The engine
+does all matrix work on these codes and decodes to text only for output.
+
+Digraph tables are dense: the digraph of codes (a, b) sits at offset
+a * len(alphabet) + b of an array('H'), two bytes per ordered pair. Each
+entry holds the resulting codes as one native uint16 (the two bytes in text
+order), so mapped digraphs are written straight back out as code bytes
+without creating any str objects.
+"""
+
+import operator
+import sys
+from array import array
+from itertools import repeat
+from typing import Callable, List, Tuple
+
+
+# Shifts that place the first / second code of a digraph in a native uint16
+if sys.byteorder == 'little':
+    _FIRST, _SECOND = 0, 8
+else:
+    _FIRST, _SECOND = 8, 0
+
+
+class Codec:
+    """Text <-> code conversion for one cipher alphabet (at most 256 characters)."""
+    
+    def __init__(self, alphabet: str):
+        """
+        Args:
+            alphabet: Cipher alphabet; a character's code is its index
+        """
+        if len(alphabet) > 256:
+            raise ValueError("Alphabet must not exceed 256 characters")
+        
+        self.alphabet = alphabet
+        self.index = {char: i for i, char in enumerate(alphabet)}
+        self.size = len(alphabet)
+        
+        self._encode = None
+        self._decode = None
+        if alphabet.isascii():
+            encode = bytearray(256)
+            decode = bytearray(256)
+            for i, char in enumerate(alphabet):
+                encode[ord(char)] = i
+                decode[i] = ord(char)
+            self._encode = bytes(encode)
+            self._decode = bytes(decode)
+    
+    def encode(self, text: str) -> bytes:
+        """
+        Convert cleaned text into one code byte per character.
+        
+        Raises:
+            KeyError: If a non-ASCII alphabet is given an unknown character
+        """
+        if self._encode is not None:
+            return text.encode('ascii').translate(self._encode)
+        return bytes(map(self.index.__getitem__, text))
+    
+    def encode_bytes(self, data: bytes) -> bytes:
+        """Convert cleaned ASCII bytes into codes (ASCII alphabets only)."""
+        return data.translate(self._encode)
+    
+    def decode(self, codes) -> str:
+        """Convert codes back into text."""
+        if self._decode is not None:
+            return bytes(codes).translate(self._decode).decode('ascii')
+        return ''.join(map(self.alphabet.__getitem__, codes))
+    
+    def decode_bytes(self, codes) -> bytes:
+        """Convert codes back into ASCII bytes (ASCII alphabets only)."""
+        return bytes(codes).translate(self._decode)
+    
+    def digraphs(self, codes) -> List[str]:
+        """Decode even-length codes into a list of 2-character digraphs."""
+        text = self.decode(codes)
+        return list(map(operator.add, text[0::2], text[1::2]))
+    
+    @staticmethod
+    def join(a: int, b: int) -> int:
+        """Return the digraph key of codes a and b (their two bytes as a native uint16)."""
+        return a << _FIRST | b << _SECOND
+    
+    @staticmethod
+    def split(key: int) -> Tuple[int, int]:
+        """Return the codes of a digraph key."""
+        return key >> _FIRST & 0xFF, key >> _SECOND & 0xFF
+    
+    def offset(self, a: int, b: int) -> int:
+        """Return the table offset of the digraph of codes a and b."""
+        return a * self.size + b
+    
+    def table(self, rule: Callable[[int, int], Tuple[int, int]]) -> array:
+        """
+        Tabulate a digraph rule over every pair of codes.
+        
+        Args:
+            rule: Maps codes (a, b) to the resulting codes
+        
+        Returns:
+            array('H') indexed by table offset holding the resulting digraph key
+        """
+        size = self.size
+        return array('H', [self.join(*rule(a, b)) for a in range(size) for b in range(size)])
+    
+    def chain(self, first: array, second: array) -> array:
+        """Return the table that applies first and then second."""
+        split = self.split
+        return array('H', [second[self.offset(*split(key))] for key in first])
+    
+    def apply(self, table: array, codes) -> bytes:
+        """Map even-length codes through a digraph table."""
+        offsets = map(operator.add, map(operator.mul, codes[0::2], repeat(self.size)), codes[1::2])
+        return array('H', map(table.__getitem__, offsets)).tobytes()
@@ -0,0 +1,521 @@
+"""
+PlayFair Cipher Engine
+Generic N×N PlayFair cipher. Concrete ciphers are thin configurations that
+set the alphabet, grid size and substitution rules as class attributes.
+"""
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from . import batch, fileio, parallel, vectorized
+from .codec import Codec
+from .compose import ComposedCipher
+from .normalize import Normalizer
+from .pairing import pair
+from .rekey import Rekeyer
+from .schedule import KeySchedule, schedule_cache
+from .stream import Decryptor, Encryptor, iter_decrypt, iter_encrypt
+
+
+class PlayFairEngine:
+    """
+    PlayFair cipher over any square grid.
+    
+    Subclasses configure the engine with class attributes:
+    
+    - ALPHABET: the SIZE * SIZE grid characters in fill order
+    - SIZE: grid width and height
+    - SUBSTITUTIONS: characters folded onto alphabet characters (e.g. J → I)
+    - CASE_FOLD: uppercase input before use
+    - PAD: filler inserted between duplicates and after odd-length text
+    - KEY_ERROR: message raised for a key without alphabet characters
+    - TITLE: heading used by print_matrix()
+    
+    Instances only hold the normalized key and a shared KeySchedule (see
+    __slots__), so many keys can be kept resident cheaply.
+    
+    Example 7x7 grid with punctuation:
+
+        class PlayFairCipher7x7(PlayFairEngine):
+            ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 .,?!\\'-:;()/&'
+            SIZE = 7
+    """
+    
+    ALPHABET = ''
+    SIZE = 0
+    SUBSTITUTIONS: Dict[str, str] = {}
+    CASE_FOLD = True
+    PAD = 'X'
+    KEY_ERROR = "Key must contain at least one character of the cipher alphabet"
+    TITLE = "PlayFair Cipher Matrix"
+    
+    __slots__ = ('key', '_schedule')
+    
+    def __init_subclass__(cls, **kwargs):
+        """Validate a subclass configuration once, at class creation."""
+        super().__init_subclass__(**kwargs)
+        if not cls.ALPHABET:
+            return
+        
+        if len(cls.ALPHABET) != cls.SIZE * cls.SIZE:
+            raise TypeError(f"{cls.__name__}: ALPHABET must have SIZE * SIZE characters")
+        if len(set(cls.ALPHABET)) != len(cls.ALPHABET):
+            raise TypeError(f"{cls.__name__}: ALPHABET characters must be unique")
+        if cls.PAD not in cls.ALPHABET:
+            raise TypeError(f"{cls.__name__}: PAD must be in ALPHABET")
+        if not set(cls.SUBSTITUTIONS.values()) <= set(cls.ALPHABET):
+            raise TypeError(f"{cls.__name__}: SUBSTITUTIONS must map into ALPHABET")
+        
+        cls._alphabet_set = frozenset(cls.ALPHABET)
+        cls._substitute = str.maketrans(cls.SUBSTITUTIONS)
+        cls._normalizer = Normalizer(cls.ALPHABET, cls.SUBSTITUTIONS, cls.CASE_FOLD)
+        cls._codec = Codec(cls.ALPHABET)
+        cls._ascii = cls.ALPHABET.isascii()
+    
+    def __init__(self, key: str):
+        """
+        Initialize the cipher with a keyword.
+        
+        Args:
+            key: The keyword used to generate the cipher matrix
+        
+        Raises:
+            ValueError: If key contains no character of the cipher alphabet
+        """
+        if not self.ALPHABET:
+            raise TypeError("PlayFairEngine must be subclassed with an ALPHABET")
+        
+        self.key = self._normalize(key or '')
+        if not any(char in self._alphabet_set for char in self.key):
+            raise ValueError(self.KEY_ERROR)
+        
+        self._schedule = schedule_cache.get((type(self), self.key), self._build_schedule)
+    
+    def _build_schedule(self) -> KeySchedule:
+        """
+        Expand the key into its flat matrix and inverse index.
+        The digraph tables are added on first use (see _tables).
+        """
+        cells = self._codec.encode(self._generate_matrix())
+        return KeySchedule(cells, self._invert(cells))
+    
+    def _generate_matrix(self) -> str:
+        """
+        Generate the cipher matrix from the key.
+        Unique key characters come first, then the rest of the alphabet.
+        
+        Returns:
+            The SIZE * SIZE matrix characters in row order
+        """
+        seen = set()
+        unique_key = []
+        
+        for char in self.key + self.ALPHABET:
+            if char in self._alphabet_set and char not in seen:
+                seen.add(char)
+                unique_key.append(char)
+        
+        return ''.join(unique_key)
+    
+    @property
+    def _cells(self) -> bytes:
+        """Matrix as flat codes in row order."""
+        return self._schedule.cells
+    
+    @property
+    def _positions(self) -> bytes:
+        """Cell index (row * SIZE + column) of every code."""
+        return self._schedule.positions
+    
+    @property
+    def matrix(self) -> Tuple[Tuple[str, ...], ...]:
+        """Read-only SIZE x SIZE view of the matrix, built on access."""
+        return tuple(map(tuple, self.get_matrix()))
+    
+    @property
+    def position_map(self) -> Dict[str, Tuple[int, int]]:
+        """Map each character to its (row, column) position, built on access."""
+        alphabet = self.ALPHABET
+        size = self.SIZE
+        return {alphabet[code]: divmod(cell, size) for code, cell in enumerate(self._positions)}
+    
+    @staticmethod
+    def _invert(cells: bytes) -> bytes:
+        """
+        Invert the flat matrix of codes.
+        
+        Returns:
+            Cell index (row * SIZE + column) of every code
+        """
+        positions = bytearray(len(cells))
+        for cell, code in enumerate(cells):
+            positions[code] = cell
+        return bytes(positions)
+    
+    def _build_tables(self) -> Tuple[array, array]:
+        """
+        Precompute the result of every ordered digraph (SIZE ** 4 pairs).
+        
+        Returns:
+            Encrypt and decrypt tables indexed by table offset (see Codec)
+        """
+        encrypt_table = self._codec.table(lambda a, b: self._code_rule(a, b, 1))
+        decrypt_table = self._codec.table(lambda a, b: self._code_rule(a, b, -1))
+        return encrypt_table, decrypt_table
+    
+    def _tables(self) -> Tuple[array, array]:
+        """Return the encrypt and decrypt tables, building them on first use."""
+        schedule = self._schedule
+        if schedule.tables is None:
+            schedule.tables = self._build_tables()
+        return schedule.tables
+    
+    @property
+    def _encrypt_table(self) -> array:
+        """Digraph encrypt table, built on first use."""
+        return self._tables()[0]
+    
+    @property
+    def _decrypt_table(self) -> array:
+        """Digraph decrypt table, built on first use."""
+        return self._tables()[1]
+    
+    def _vector_tables(self) -> 'vectorized.VectorTables':
+        """Return the NumPy form of the tables, building it on first use."""
+        if self._schedule.vector is None:
+            self._schedule.vector = vectorized.VectorTables(self)
+        return self._schedule.vector
+    
+    def _byte_tables(self) -> 'fileio.ByteTables':
+        """Return the byte-level form of the tables, building it on first use."""
+        if self._normalizer.translate is None:
+            raise ValueError("Byte-level processing requires an ASCII alphabet")
+        if self._schedule.bytes is None:
+            self._schedule.bytes = fileio.ByteTables(self)
+        return self._schedule.bytes
+    
+    def _vectorizable(self, text: str) -> bool:
+        """Return True if the NumPy backend should process text."""
+        return self._ascii and vectorized.usable(text)
+    
+    def get_matrix(self) -> List[List[str]]:
+        """Return a copy of the cipher matrix as a list of lists."""
+        text = self._codec.decode(self._cells)
+        size = self.SIZE
+        return [list(text[i:i + size]) for i in range(0, size * size, size)]
+    
+    def print_matrix(self) -> None:
+        """Print the cipher matrix in a readable format."""
+        width = 4 * self.SIZE + 1
+        print(f"\n{self.TITLE}:")
+        print("─" * width)
+        for row in self.get_matrix():
+            print("│ " + " ".join(row) + " │")
+        print("─" * width)
+    
+    def _normalize(self, text: str) -> str:
+        """Apply case folding and substitutions without filtering."""
+        if self.CASE_FOLD:
+            text = text.upper()
+        return text.translate(self._substitute)
+    
+    def _clean(self, text: str) -> str:
+        """Normalize text and keep only characters of the cipher alphabet."""
+        return self._normalizer.clean(text)
+    
+    def _prepare(self, text: str) -> str:
+        """
+        Clean text and pair it into an even-length string of digraphs.
+        Inserts the pad character between duplicates and after odd-length text.
+        """
+        prepared, leftover = pair(self._clean(text), self.PAD)
+        if leftover:
+            prepared += leftover + self.PAD
+        return prepared
+    
+    def _prepare_codes(self, text: str) -> bytes:
+        """Clean and pair text, returning it as even-length alphabet codes."""
+        return self._codec.encode(self._prepare(text))
+    
+    def _prepare_text(self, text: str) -> List[str]:
+        """
+        Prepare text for encryption by creating digraphs.
+        Inserts 'X' between duplicates and pads odd-length text.
+        
+        Returns:
+            List of digraphs (2-character pairs)
+        """
+        return self._codec.digraphs(self._prepare_codes(text))
+    
+    def _code_rule(self, a: int, b: int, shift: int) -> Tuple[int, int]:
+        """
+        Apply PlayFair cipher rules to a digraph of alphabet codes.
+        
+        Rules:
+        - Same row: shift horizontally (right for encrypt, left for decrypt)
+        - Same column: shift vertically (down for encrypt, up for decrypt)
+        - Rectangle: swap columns
+        
+        Args:
+            a: Code of the first character
+            b: Code of the second character
+            shift: 1 to encrypt, -1 to decrypt
+        
+        Returns:
+            Codes of the resulting digraph
+        """
+        size = self.SIZE
+        row1, col1 = divmod(self._positions[a], size)
+        row2, col2 = divmod(self._positions[b], size)
+        
+        if row1 == row2:
+            # Same row - shift horizontally
+            col1 = (col1 + shift) % size
+            col2 = (col2 + shift) % size
+        
+        elif col1 == col2:
+            # Same column - shift vertically
+            row1 = (row1 + shift) % size
+            row2 = (row2 + shift) % size
+        
+        else:
+            # Rectangle - swap columns
+            col1, col2 = col2, col1
+        
+        return self._cells[row1 * size + col1], self._cells[row2 * size + col2]
+    
+    def _apply_rule(self, a: str, b: str, mode: str = 'encrypt') -> str:
+        """
+        Apply PlayFair cipher rules to a digraph.
+        
+        Args:
+            a: First character of digraph
+            b: Second character of digraph
+            mode: 'encrypt' or 'decrypt'
+        
+        Returns:
+            Encrypted or decrypted digraph
+        """
+        codec = self._codec
+        table = self._encrypt_table if mode == 'encrypt' else self._decrypt_table
+        first, second = codec.split(table[codec.offset(codec.index[a], codec.index[b])])
+        return self.ALPHABET[first] + self.ALPHABET[second]
+    
+    def _apply_tables(self, text: str, mode: str = 'encrypt') -> str:
+        """
+        Apply the encrypt or decrypt table to cleaned, even-length text.
+        Uses the NumPy backend for long ASCII input when available.
+        
+        Args:
+            text: Cleaned text with an even number of characters
+            mode: 'encrypt' or 'decrypt'
+        
+        Returns:
+            Transformed text
+        """
+        if self._vectorizable(text):
+            return self._vector_tables().apply(text, mode=mode)
+        
+        codec = self._codec
+        table = self._encrypt_table if mode == 'encrypt' else self._decrypt_table
+        return codec.decode(codec.apply(table, codec.encode(text)))
+    
+    def encrypt(self, plaintext: str, verbose: bool = False) -> str:
+        """
+        Encrypt plaintext using the PlayFair cipher.
+        
+        Args:
+            plaintext: Text to encrypt
+            verbose: If True, print encryption steps
+        
+        Returns:
+            Encrypted ciphertext
+        """
+        if not verbose:
+            return self._apply_tables(self._prepare(plaintext), mode='encrypt')
+        
+        codes = self._prepare_codes(plaintext)
+        digraphs = self._codec.digraphs(codes)
+        
+        print(f"\nOriginal text: {plaintext}")
+        print(f"Prepared digraphs: {' '.join(digraphs)}")
+        print("\nEncryption steps:")
+        
+        ciphertext = self._codec.digraphs(self._codec.apply(self._encrypt_table, codes))
+        
+        for digraph, encrypted in zip(digraphs, ciphertext):
+            print(f"  {digraph} → {encrypted}")
+        
+        result = ''.join(ciphertext)
+        
+        print(f"\nCiphertext: {result}")
+        
+        return result
+    
+    def decrypt(self, ciphertext: str, verbose: bool = False) -> str:
+        """
+        Decrypt ciphertext using the PlayFair cipher.
+        
+        Args:
+            ciphertext: Text to decrypt
+            verbose: If True, print decryption steps
+        
+        Returns:
+            Decrypted plaintext
+        """
+        if not verbose:
+            if self._vectorizable(ciphertext):
+                return self._vector_tables().apply(ciphertext, mode='decrypt')
+            ciphertext = self._clean(ciphertext)
+            return self._apply_tables(ciphertext[:len(ciphertext) // 2 * 2], mode='decrypt')
+        
+        ciphertext = self._clean(ciphertext)
+        
+        # Split into digraphs; a trailing unpaired character is shown but not decrypted
+        digraphs = [ciphertext[i:i+2] for i in range(0, len(ciphertext), 2)]
+        codes = self._codec.encode(ciphertext[:len(ciphertext) // 2 * 2])
+        
+        print(f"\nCiphertext: {ciphertext}")
+        print(f"Digraphs: {' '.join(digraphs)}")
+        print("\nDecryption steps:")
+        
+        plaintext = self._codec.digraphs(self._codec.apply(self._decrypt_table, codes))
+        
+        for digraph, decrypted in zip(digraphs, plaintext):
+            print(f"  {digraph} → {decrypted}")
+        
+        result = ''.join(plaintext)
+        
+        print(f"\nPlaintext: {result}")
+        
+        return result
+    
+    def encryptor(self) -> Encryptor:
+        """
+        Return an incremental encryptor for chunked plaintext.
+        Its joined output equals encrypt() on the joined chunks.
+        """
+        return Encryptor(self)
+    
+    def decryptor(self) -> Decryptor:
+        """
+        Return an incremental decryptor for chunked ciphertext.
+        Its joined output equals decrypt() on the joined chunks.
+        """
+        return Decryptor(self)
+    
+    def iter_encrypt(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Lazily encrypt an iterable of plaintext chunks."""
+        return iter_encrypt(self, chunks)
+    
+    def iter_decrypt(self, chunks: Iterable[str], workers: Optional[int] = None) -> Iterator[str]:
+        """
+        Lazily decrypt an iterable of ciphertext chunks.
+        With workers > 1 the chunks are decrypted in a process pool.
+        """
+        if workers is not None and workers > 1:
+            return parallel.iter_decrypt_parallel(self, chunks, workers=workers)
+        return iter_decrypt(self, chunks)
+    
+    def decrypt_file(self, src, dst) -> int:
+        """
+        Decrypt the file src into dst through memory maps.
+        
+        Returns:
+            Number of plaintext bytes written
+        """
+        return fileio.decrypt_file(self, src, dst)
+    
+    def decrypt_bulk(self, ciphertext: str, workers: Optional[int] = None) -> str:
+        """
+        Decrypt a large ciphertext across worker processes.
+        Same result as decrypt(); workers defaults to the CPU count.
+        """
+        return parallel.decrypt_parallel(self, ciphertext, workers=workers)
+    
+    def encrypt_bulk(self, plaintext: str, workers: Optional[int] = None) -> str:
+        """
+        Encrypt a large plaintext across worker processes.
+        Same result as encrypt(); workers defaults to the CPU count.
+        """
+        return parallel.encrypt_parallel(self, plaintext, workers=workers)
+    
+    @classmethod
+    def encrypt_many(cls, items: Iterable, key: Optional[str] = None,
+                     workers: Optional[int] = None) -> List[str]:
+        """
+        Encrypt many messages, building each key's cipher only once.
+        
+        Args:
+            items: (key, plaintext) pairs, or plaintexts when key is given
+            key: Keyword shared by every item
+            workers: Spread key groups over this many processes
+        
+        Returns:
+            Ciphertexts in input order
+        """
+        return batch.process_many(cls, items, mode='encrypt', key=key, workers=workers)
+    
+    @classmethod
+    def decrypt_many(cls, items: Iterable, key: Optional[str] = None,
+                     workers: Optional[int] = None) -> List[str]:
+        """
+        Decrypt many messages, building each key's cipher only once.
+        
+        Args:
+            items: (key, ciphertext) pairs, or ciphertexts when key is given
+            key: Keyword shared by every item
+            workers: Spread key groups over this many processes
+        
+        Returns:
+            Plaintexts in input order
+        """
+        return batch.process_many(cls, items, mode='decrypt', key=key, workers=workers)
+    
+    @classmethod
+    def encrypt_fanout(cls, plaintext: str, keys: Iterable[str]) -> Iterator[str]:
+        """
+        Encrypt one plaintext under many keys, preparing it only once.
+        
+        Args:
+            plaintext: Text to encrypt
+            keys: Keywords, consumed lazily
+        
+        Returns:
+            Iterator of ciphertexts, one per key, in key order
+        """
+        return batch.fan_out(cls, plaintext, keys, mode='encrypt')
+    
+    @classmethod
+    def compose(cls, keys: Iterable[str]) -> ComposedCipher:
+        """
+        Chain one cipher per key into a single multi-round cipher.
+        
+        Args:
+            keys: Keywords in encryption order
+        
+        Returns:
+            ComposedCipher whose encrypt() equals encrypting with each key in turn
+        """
+        return ComposedCipher([cls(key) for key in keys])
+    
+    @classmethod
+    def rekey(cls, ciphertext: str, old_key: str, new_key: str) -> str:
+        """
+        Translate ciphertext from old_key to new_key in one pass.
+        The plaintext is never built; see Rekeyer.
+        
+        Returns:
+            Ciphertext that decrypts under new_key to the same text
+        """
+        return Rekeyer(cls(old_key), cls(new_key)).rekey(ciphertext)
+    
+    @classmethod
+    def rekey_file(cls, src, dst, old_key: str, new_key: str) -> int:
+        """
+        Translate the ciphertext file src from old_key to new_key into dst.
+        
+        Returns:
+            Number of bytes written
+        """
+        return Rekeyer(cls(old_key), cls(new_key)).rekey_file(src, dst)
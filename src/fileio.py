@@ -0,0 +1,110 @@
+"""
+PlayFair Cipher File Processing
+Length-preserving decryption of whole files through memory maps.
+"""
+
+import mmap
+import os
+
+from . import vectorized
+
+
+# Input is processed in blocks of this many bytes
+BLOCK_SIZE = 1 << 20
+
+
+class ByteTables:
+    """
+    Byte-level form of a cipher's normalization and digraph tables.
+    
+    Cleaned bytes are translated to alphabet codes and mapped through the
+    cipher's code tables, so no str objects are created.
+    """
+    
+    def __init__(self, cipher):
+        """
+        Args:
+            cipher: PlayFairEngine instance (e.g. PlayFairCipher)
+        """
+        self._normalizer = cipher._normalizer
+        self._codec = cipher._codec
+        self.decrypt = cipher._decrypt_table
+    
+    def clean(self, data) -> bytes:
+        """Uppercase and fold raw bytes, dropping non-alphabet bytes."""
+        return self._normalizer.clean_bytes(data)
+    
+    def lookup(self, data: bytes) -> bytes:
+        """Decrypt cleaned, even-length bytes."""
+        codec = self._codec
+        return codec.decode_bytes(codec.apply(self.decrypt, codec.encode_bytes(data)))
+
+
+def decrypt_file(cipher, src, dst, block_size: int = BLOCK_SIZE) -> int:
+    """
+    Decrypt the file src into dst using memory maps.
+    
+    The output file is preallocated to the input size and decrypted bytes are
+    written straight into its mapping; it is then truncated to the number of
+    bytes produced. Non-alphabet and non-ASCII bytes in the input are ignored.
+    
+    Args:
+        cipher: PlayFairEngine instance (e.g. PlayFairCipher)
+        src: Path of the ciphertext file
+        dst: Path of the plaintext file to create
+        block_size: Bytes of input processed per step
+    
+    Returns:
+        Number of bytes written to dst
+    """
+    with open(src, 'rb') as source_file, open(dst, 'w+b') as target_file:
+        size = os.fstat(source_file.fileno()).st_size
+        if size == 0:
+            return 0
+        
+        target_file.truncate(size)
+        with mmap.mmap(source_file.fileno(), 0, access=mmap.ACCESS_READ) as source, \
+                mmap.mmap(target_file.fileno(), size) as target:
+            if vectorized.np is not None and cipher._ascii:
+                written = _decrypt_vectorized(cipher, source, target, block_size)
+            else:
+                written = _decrypt_bytes(cipher, source, target, block_size)
+        
+        target_file.truncate(written)
+    return written
+
+
+def _decrypt_bytes(cipher, source, target, block_size: int) -> int:
+    """Pure-Python block loop using the 16-bit byte tables."""
+    tables = cipher._byte_tables()
+    written = 0
+    pending = b''
+    for start in range(0, len(source), block_size):
+        data = pending + tables.clean(source[start:start + block_size])
+        cut = len(data) - len(data) % 2
+        pending = data[cut:]
+        target[written:written + cut] = tables.lookup(data[:cut])
+        written += cut
+    return written
+
+
+def _decrypt_vectorized(cipher, source, target, block_size: int) -> int:
+    """NumPy block loop writing into a view of the target mapping."""
+    np = vectorized.np
+    tables = cipher._vector_tables()
+    output = np.frombuffer(target, dtype=np.uint8)
+    try:
+        written = 0
+        pending = np.empty(0, dtype=np.uint8)
+        for start in range(0, len(source), block_size):
+            codes = tables.clean(source[start:start + block_size])
+            if len(pending):
+                codes = np.concatenate((pending, codes))
+            cut = len(codes) - len(codes) % 2
+            pending = codes[cut:]
+            output[written:written + cut] = tables.lookup(codes[:cut], mode='decrypt')
+            written += cut
+        return written
+    finally:
+        # The mapping cannot be closed while a NumPy view still exports it
+        del output
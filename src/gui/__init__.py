@@ -1,5 +1,11 @@
 """GUI package initialization."""
 
-from .app import PlayFairGUI
-
 __all__ = ["PlayFairGUI"]
+
+
+def __getattr__(name):
+    # Imported on first use, so the Tk-free modules work without tkinter
+    if name == "PlayFairGUI":
+        from .app import PlayFairGUI
+        return PlayFairGUI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
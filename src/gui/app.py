@@ -3,12 +3,27 @@ PlayFair Cipher - Graphical User Interface
 """
 
 import tkinter as tk
-from tkinter import scrolledtext, messagebox
+from tkinter import scrolledtext, messagebox, filedialog, ttk
 import sys
 import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 from src.cipher import PlayFairCipher
+from src.gui.log import LogView
+from src.incremental import LiveEncryption
+from src.gui.worker import BackgroundJob, transform, transform_file
+
+
+# Matrix cell colors: normal, input digraph and output digraph of a step
+CELL_COLOR = '#3498db'
+SOURCE_COLOR = '#e67e22'
+TARGET_COLOR = '#27ae60'
+
+# Milliseconds of typing pause before the ciphertext is updated
+LIVE_DELAY = 150
+
+# Non-printing keys that edit a text box (and so end a file preview)
+EDIT_KEYS = ('BackSpace', 'Delete', 'Return')
 
 
 class PlayFairGUI:
@@ -20,6 +35,14 @@ class PlayFairGUI:
         self.root.minsize(900, 650)
         
         self.cipher = None
+        self.job = None
+        self.live = None
+        self._live_after = None
+        self._writing = False
+        self.file_preview = False
+        self.highlighted = []
+        self.trace_key = None
+        self.job_key = None
         self.setup_ui()
     
     def setup_ui(self):
@@ -45,6 +68,33 @@ class PlayFairGUI:
         )
         subtitle_label.pack(pady=(0, 20))
         
+        status_frame = tk.Frame(main_frame, bg='#f0f0f0')
+        status_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=(10, 0))
+        
+        self.status_label = tk.Label(
+            status_frame,
+            text="Ready",
+            font=('Arial', 9),
+            bg='#f0f0f0',
+            fg='#7f8c8d',
+            anchor=tk.W
+        )
+        self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        self.cancel_btn = tk.Button(
+            status_frame,
+            text="Cancel",
+            command=self.cancel_job,
+            font=('Arial', 9),
+            relief=tk.FLAT,
+            state=tk.DISABLED,
+            padx=10
+        )
+        self.cancel_btn.pack(side=tk.RIGHT, padx=(10, 0))
+        
+        self.progress = ttk.Progressbar(status_frame, length=200, maximum=100)
+        self.progress.pack(side=tk.RIGHT)
+        
         content_frame = tk.Frame(main_frame, bg='#f0f0f0')
         content_frame.pack(fill=tk.BOTH, expand=True)
         
@@ -75,6 +125,7 @@ class PlayFairGUI:
         )
         self.keyword_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
         self.keyword_entry.insert(0, "MONARCHY")
+        self.keyword_entry.bind('<KeyRelease>', self.preview_matrix)
         
         generate_btn = tk.Button(
             keyword_input_frame,
@@ -101,12 +152,25 @@ class PlayFairGUI:
         )
         message_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
+        plaintext_header = tk.Frame(message_frame, bg='#ffffff')
+        plaintext_header.pack(fill=tk.X)
+        
         tk.Label(
-            message_frame,
+            plaintext_header,
             text="Plaintext:",
             font=('Arial', 10),
             bg='#ffffff'
-        ).pack(anchor=tk.W)
+        ).pack(side=tk.LEFT)
+        
+        self.live_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(
+            plaintext_header,
+            text="Live encryption",
+            variable=self.live_var,
+            command=self.toggle_live,
+            font=('Arial', 9),
+            bg='#ffffff'
+        ).pack(side=tk.RIGHT)
         
         self.plaintext_box = scrolledtext.ScrolledText(
             message_frame,
@@ -116,11 +180,14 @@ class PlayFairGUI:
         )
         self.plaintext_box.pack(fill=tk.BOTH, expand=True, pady=(5, 10))
         self.plaintext_box.insert('1.0', "HELLO WORLD")
+        self.plaintext_box.bind('<<Modified>>', self.on_plaintext_modified)
+        self.plaintext_box.bind('<Key>', self.on_preview_key, add='+')
+        self.plaintext_box.bind('<<Paste>>', self.clear_file_preview, add='+')
         
         button_frame = tk.Frame(message_frame, bg='#ffffff')
         button_frame.pack(fill=tk.X)
         
-        encrypt_btn = tk.Button(
+        self.encrypt_btn = tk.Button(
             button_frame,
             text="⬇ Encrypt",
             command=self.encrypt_message,
@@ -132,9 +199,9 @@ class PlayFairGUI:
             padx=20,
             pady=8
         )
-        encrypt_btn.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=(0, 5))
+        self.encrypt_btn.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=(0, 5))
         
-        decrypt_btn = tk.Button(
+        self.decrypt_btn = tk.Button(
             button_frame,
             text="⬆ Decrypt",
             command=self.decrypt_message,
@@ -146,7 +213,32 @@ class PlayFairGUI:
             padx=20,
             pady=8
         )
-        decrypt_btn.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=(5, 0))
+        self.decrypt_btn.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=(5, 0))
+        
+        file_frame = tk.Frame(message_frame, bg='#ffffff')
+        file_frame.pack(fill=tk.X, pady=(5, 0))
+        
+        self.encrypt_file_btn = tk.Button(
+            file_frame,
+            text="Encrypt File...",
+            command=lambda: self.process_file('encrypt'),
+            font=('Arial', 9),
+            cursor='hand2',
+            relief=tk.FLAT,
+            padx=10
+        )
+        self.encrypt_file_btn.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=(0, 5))
+        
+        self.decrypt_file_btn = tk.Button(
+            file_frame,
+            text="Decrypt File...",
+            command=lambda: self.process_file('decrypt'),
+            font=('Arial', 9),
+            cursor='hand2',
+            relief=tk.FLAT,
+            padx=10
+        )
+        self.decrypt_file_btn.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=(5, 0))
         
         tk.Label(
             message_frame,
@@ -162,6 +254,9 @@ class PlayFairGUI:
             wrap=tk.WORD
         )
         self.ciphertext_box.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+        self.ciphertext_box.bind('<<Modified>>', self.on_ciphertext_modified)
+        self.ciphertext_box.bind('<Key>', self.on_preview_key, add='+')
+        self.ciphertext_box.bind('<<Paste>>', self.clear_file_preview, add='+')
         
         log_frame = tk.LabelFrame(
             left_frame,
@@ -174,14 +269,23 @@ class PlayFairGUI:
         )
         log_frame.pack(fill=tk.BOTH, expand=True)
         
-        self.process_log = scrolledtext.ScrolledText(
+        tk.Button(
+            log_frame,
+            text="Export Log...",
+            command=self.export_log,
+            font=('Arial', 9),
+            relief=tk.FLAT,
+            padx=10
+        ).pack(side=tk.BOTTOM, anchor=tk.E, pady=(5, 0))
+        
+        self.process_log = LogView(
             log_frame,
             height=8,
             font=('Courier', 9),
-            wrap=tk.WORD,
             bg='#f8f9fa'
         )
         self.process_log.pack(fill=tk.BOTH, expand=True)
+        self.process_log.on_select = self.highlight_step
         
         matrix_frame = tk.LabelFrame(
             right_frame,
@@ -197,6 +301,25 @@ class PlayFairGUI:
         self.matrix_display = tk.Frame(matrix_frame, bg='#ffffff')
         self.matrix_display.pack()
         
+        self.matrix_labels = []
+        for i in range(5):
+            row = []
+            for j in range(5):
+                label = tk.Label(
+                    self.matrix_display,
+                    text='',
+                    font=('Courier', 16, 'bold'),
+                    width=3,
+                    height=1,
+                    bg=CELL_COLOR,
+                    fg='white',
+                    relief=tk.RAISED,
+                    borderwidth=2
+                )
+                label.grid(row=i, column=j, padx=2, pady=2)
+                row.append(label)
+            self.matrix_labels.append(row)
+        
         info_frame = tk.LabelFrame(
             right_frame,
             text="Algorithm Rules",
@@ -246,35 +369,67 @@ Padding: X inserted
             return
         
         try:
-            self.cipher = PlayFairCipher(keyword)
-            self.display_matrix()
+            self.set_cipher(PlayFairCipher(keyword))
             self.log_message(f"Matrix generated: {keyword}\n")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate matrix: {str(e)}")
     
-    def display_matrix(self):
-        """Display the cipher matrix visually."""
-        for widget in self.matrix_display.winfo_children():
-            widget.destroy()
+    def preview_matrix(self, event=None):
+        """Regenerate the matrix as the keyword is typed; invalid keys are ignored."""
+        keyword = self.keyword_entry.get().strip()
+        if not keyword:
+            return
         
+        try:
+            cipher = PlayFairCipher(keyword)
+        except ValueError:
+            return
+        if self.cipher is None or cipher.key != self.cipher.key:
+            self.set_cipher(cipher)
+    
+    def set_cipher(self, cipher):
+        """Switch to a new cipher and refresh the matrix and live ciphertext."""
+        self.cipher = cipher
+        self.display_matrix()
+        self.live = None
+        self.schedule_live_update()
+    
+    def display_matrix(self):
+        """Display the cipher matrix visually, reusing the cell labels."""
+        self.highlight_cells()
         if not self.cipher:
             return
         
-        for i in range(5):
-            for j in range(5):
-                letter = self.cipher.get_matrix()[i][j]
-                label = tk.Label(
-                    self.matrix_display,
-                    text=letter,
-                    font=('Courier', 16, 'bold'),
-                    width=3,
-                    height=1,
-                    bg='#3498db',
-                    fg='white',
-                    relief=tk.RAISED,
-                    borderwidth=2
-                )
-                label.grid(row=i, column=j, padx=2, pady=2)
+        for labels, letters in zip(self.matrix_labels, self.cipher.get_matrix()):
+            for label, letter in zip(labels, letters):
+                if label['text'] != letter:
+                    label.config(text=letter)
+    
+    def highlight_cells(self, source='', target=''):
+        """Highlight the matrix cells of a step's input and output digraphs."""
+        for label in self.highlighted:
+            label.config(bg=CELL_COLOR)
+        self.highlighted = []
+        
+        positions = self.cipher.position_map if self.cipher else {}
+        for letters, color in ((source, SOURCE_COLOR), (target, TARGET_COLOR)):
+            for letter in letters:
+                if letter in positions:
+                    row, col = positions[letter]
+                    label = self.matrix_labels[row][col]
+                    label.config(bg=color)
+                    self.highlighted.append(label)
+    
+    def highlight_step(self, index):
+        """Show the cells used by the clicked log line, if it is a digraph step."""
+        step = self.process_log.log.step_at(index)
+        if step is None or self.cipher is None or self.trace_key != self.cipher.key:
+            self.highlight_cells()
+            return
+        
+        source, target = step
+        self.highlight_cells(source, target)
+        self.status_label.config(text=f"{source} → {target}")
     
     def encrypt_message(self):
         """Encrypt the plaintext message."""
@@ -282,36 +437,13 @@ Padding: X inserted
             messagebox.showwarning("Warning", "Generate matrix first")
             return
         
-        plaintext = self.plaintext_box.get('1.0', tk.END).strip()
+        plaintext = '' if self.file_preview else self.plaintext_box.get('1.0', tk.END).strip()
         
         if not plaintext:
             messagebox.showwarning("Warning", "Enter message to encrypt")
             return
         
-        try:
-            self.process_log.delete('1.0', tk.END)
-            
-            self.log_message("ENCRYPTION")
-            self.log_message("="*40 + "\n")
-            self.log_message(f"Input: {plaintext}\n")
-            
-            digraphs = self.cipher._prepare_text(plaintext)
-            self.log_message(f"Digraphs: {' '.join(digraphs)}\n")
-            
-            ciphertext_parts = []
-            for digraph in digraphs:
-                encrypted = self.cipher._apply_rule(digraph[0], digraph[1], mode='encrypt')
-                ciphertext_parts.append(encrypted)
-                self.log_message(f"{digraph} → {encrypted}")
-            
-            ciphertext = ''.join(ciphertext_parts)
-            self.log_message(f"\nOutput: {ciphertext}")
-            
-            self.ciphertext_box.delete('1.0', tk.END)
-            self.ciphertext_box.insert('1.0', ciphertext)
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Encryption failed: {str(e)}")
+        self.start_job('encrypt', plaintext)
     
     def decrypt_message(self):
         """Decrypt the ciphertext message."""
@@ -319,46 +451,255 @@ Padding: X inserted
             messagebox.showwarning("Warning", "Generate matrix first")
             return
         
-        ciphertext = self.ciphertext_box.get('1.0', tk.END).strip()
+        ciphertext = '' if self.file_preview else self.ciphertext_box.get('1.0', tk.END).strip()
         
         if not ciphertext:
             messagebox.showwarning("Warning", "Enter message to decrypt")
             return
         
-        try:
-            self.process_log.delete('1.0', tk.END)
-            
-            self.log_message("DECRYPTION")
-            self.log_message("="*40 + "\n")
-            
-            clean_ciphertext = ciphertext.upper().replace('J', 'I')
-            clean_ciphertext = ''.join([c for c in clean_ciphertext if c.isalpha()])
-            
-            self.log_message(f"Input: {clean_ciphertext}\n")
-            
-            digraphs = [clean_ciphertext[i:i+2] for i in range(0, len(clean_ciphertext), 2)]
-            self.log_message(f"Digraphs: {' '.join(digraphs)}\n")
-            
-            plaintext_parts = []
-            for digraph in digraphs:
-                if len(digraph) == 2:
-                    decrypted = self.cipher._apply_rule(digraph[0], digraph[1], mode='decrypt')
-                    plaintext_parts.append(decrypted)
-                    self.log_message(f"{digraph} → {decrypted}")
-            
-            plaintext = ''.join(plaintext_parts)
-            self.log_message(f"\nOutput: {plaintext}")
-            
-            self.plaintext_box.delete('1.0', tk.END)
-            self.plaintext_box.insert('1.0', plaintext)
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Decryption failed: {str(e)}")
+        self.start_job('decrypt', ciphertext)
+    
+    def start_job(self, mode, text):
+        """Run encryption or decryption on a worker thread."""
+        if self.job is not None and self.job.running:
+            return
+        
+        cipher = self.cipher
+        self.job_key = cipher.key
+        self.process_log.clear()
+        self.highlight_cells()
+        self.set_busy(True)
+        self.job = BackgroundJob(
+            self.root,
+            lambda job: transform(job, cipher, text, mode),
+            on_done=lambda transcript: self.finish_job(mode, text, transcript),
+            on_error=lambda error: self.fail_job(mode, error),
+            on_progress=self.show_progress,
+            on_cancel=lambda: self.stop_job("Cancelled")
+        ).start()
+    
+    def finish_job(self, mode, text, transcript):
+        """Show the result and trace of a completed job."""
+        if mode == 'encrypt':
+            lines = ["ENCRYPTION", "="*40 + "\n", f"Input: {text}\n"]
+            target = self.ciphertext_box
+        else:
+            lines = ["DECRYPTION", "="*40 + "\n", f"Input: {transcript.source}\n"]
+            target = self.plaintext_box
+        
+        source = iter(transcript.source)
+        lines.append(f"Digraphs: {' '.join(map(''.join, zip(source, source)))}\n")
+        self.process_log.log.append('\n'.join(lines))
+        self.process_log.log.add_steps(transcript.source, transcript.output)
+        self.log_message(f"\nOutput: {transcript.output}")
+        
+        self.set_text(target, transcript.output)
+        self.live = None
+        self.trace_key = self.job_key
+        
+        self.progress['value'] = 100
+        action = "Encrypted" if mode == 'encrypt' else "Decrypted"
+        self.stop_job(f"{action} {len(transcript.source):,} characters in "
+                      f"{self.job.elapsed:.2f} s ({self.job.rate:,.0f} chars/s)")
+    
+    def process_file(self, mode):
+        """Stream a file through the cipher into a new file in the background."""
+        if not self.cipher:
+            messagebox.showwarning("Warning", "Generate matrix first")
+            return
+        if self.job is not None and self.job.running:
+            return
+        
+        src = filedialog.askopenfilename(title=f"Open File to {mode.capitalize()}")
+        if not src:
+            return
+        suffix = '.enc' if mode == 'encrypt' else '.dec'
+        dst = filedialog.asksaveasfilename(
+            title="Save Result As",
+            initialfile=os.path.basename(src) + suffix
+        )
+        if not dst:
+            return
+        
+        cipher = self.cipher
+        self.process_log.clear()
+        self.highlight_cells()
+        self.set_busy(True)
+        self.job = BackgroundJob(
+            self.root,
+            lambda job: transform_file(job, cipher, src, dst, mode),
+            on_done=lambda result: self.finish_file_job(mode, src, dst, result),
+            on_error=lambda error: self.fail_job(mode, error),
+            on_progress=self.show_progress,
+            on_cancel=lambda: self.stop_job("Cancelled"),
+            unit='bytes'
+        ).start()
+    
+    def finish_file_job(self, mode, src, dst, result):
+        """Show previews and sizes of a processed file."""
+        action = "Encrypted" if mode == 'encrypt' else "Decrypted"
+        source_text = f"[{os.path.basename(src)}: {result.source_bytes:,} bytes]\n{result.source.render()}"
+        output_text = f"[{os.path.basename(dst)}: {result.output_bytes:,} bytes]\n{result.output.render()}"
+        if mode == 'encrypt':
+            self.show_file_preview(source_text, output_text)
+        else:
+            self.show_file_preview(output_text, source_text)
+        
+        self.log_message(f"FILE {mode.upper()}ION")
+        self.log_message("="*40 + "\n")
+        self.log_message(f"Input: {src} ({result.source_bytes:,} bytes)")
+        self.log_message(f"Output: {dst} ({result.output_bytes:,} bytes)")
+        self.log_message("\nThe previews are read-only; type or paste into a text box to enter a new message.")
+        
+        self.progress['value'] = 100
+        self.stop_job(f"{action} {result.source_bytes:,} bytes in {self.job.elapsed:.2f} s "
+                      f"({self.job.rate:,.0f} bytes/s) to {dst}")
+    
+    def show_file_preview(self, plaintext, ciphertext):
+        """
+        Show file previews in the text boxes, read-only.
+        
+        A preview is cut short and carries a header line, so it is not valid
+        input: the boxes stay disabled, and encryption, decryption and live
+        updates ignore them until clear_file_preview() is called.
+        """
+        for box, text in ((self.plaintext_box, plaintext), (self.ciphertext_box, ciphertext)):
+            box.config(state=tk.NORMAL)
+            self.set_text(box, text)
+            box.config(state=tk.DISABLED)
+        self.file_preview = True
+        self.live = None
+    
+    def clear_file_preview(self, event=None):
+        """Empty the text boxes and make them editable again after a file preview."""
+        if not self.file_preview:
+            return
+        self.file_preview = False
+        for box in (self.plaintext_box, self.ciphertext_box):
+            box.config(state=tk.NORMAL)
+            self.set_text(box, '')
+    
+    def on_preview_key(self, event):
+        """Clear a file preview once the user types into a box; copying and moving keep it."""
+        if self.file_preview and ((event.char and event.char.isprintable())
+                                  or event.keysym in EDIT_KEYS):
+            self.clear_file_preview()
+    
+    def fail_job(self, mode, error):
+        """Report a failed job."""
+        self.stop_job("Failed")
+        action = "Encryption" if mode == 'encrypt' else "Decryption"
+        messagebox.showerror("Error", f"{action} failed: {str(error)}")
+    
+    def show_progress(self, job):
+        """Update the progress bar and throughput while a job runs."""
+        if job.total:
+            self.progress['value'] = 100 * job.done / job.total
+        self.status_label.config(
+            text=f"Working... {job.done:,} / {job.total:,} {job.unit} ({job.rate:,.0f} {job.unit}/s)")
+    
+    def cancel_job(self):
+        """Cancel the running job."""
+        if self.job is not None and self.job.running:
+            self.job.cancel()
+            self.status_label.config(text="Cancelling...")
+    
+    def stop_job(self, status):
+        """Return to the idle state."""
+        self.set_busy(False)
+        self.status_label.config(text=status)
+    
+    def set_busy(self, busy):
+        """Enable or disable the controls while a job runs."""
+        self.encrypt_btn.config(state=tk.DISABLED if busy else tk.NORMAL)
+        self.decrypt_btn.config(state=tk.DISABLED if busy else tk.NORMAL)
+        self.encrypt_file_btn.config(state=tk.DISABLED if busy else tk.NORMAL)
+        self.decrypt_file_btn.config(state=tk.DISABLED if busy else tk.NORMAL)
+        self.cancel_btn.config(state=tk.NORMAL if busy else tk.DISABLED)
+        if busy:
+            self.progress['value'] = 0
+    
+    def set_text(self, box, text):
+        """Replace the contents of a text box without triggering live updates."""
+        self._writing = True
+        box.delete('1.0', tk.END)
+        box.insert('1.0', text)
+        box.edit_modified(False)
+        self._writing = False
+    
+    def toggle_live(self):
+        """Bring the ciphertext up to date when live encryption is switched on."""
+        self.live = None
+        self.schedule_live_update()
+    
+    def on_plaintext_modified(self, event=None):
+        """Schedule a live update when the user edits the plaintext."""
+        if not self.plaintext_box.edit_modified():
+            return
+        self.plaintext_box.edit_modified(False)
+        if not self._writing:
+            self.schedule_live_update()
+    
+    def on_ciphertext_modified(self, event=None):
+        """Drop the live state when the user edits the ciphertext."""
+        if not self.ciphertext_box.edit_modified():
+            return
+        self.ciphertext_box.edit_modified(False)
+        if not self._writing:
+            self.live = None
+    
+    def schedule_live_update(self):
+        """Run update_live once typing pauses for LIVE_DELAY ms."""
+        if not self.live_var.get():
+            return
+        if self._live_after is not None:
+            self.root.after_cancel(self._live_after)
+        self._live_after = self.root.after(LIVE_DELAY, self.update_live)
+    
+    def update_live(self):
+        """Re-encrypt only the digraphs affected by edits since the last update."""
+        self._live_after = None
+        if not self.cipher or not self.live_var.get() or self.file_preview:
+            return
+        if self.job is not None and self.job.running:
+            self.schedule_live_update()
+            return
+        
+        text = self.plaintext_box.get('1.0', 'end-1c')
+        if self.live is None:
+            self.live = LiveEncryption(self.cipher, text)
+            self.set_text(self.ciphertext_box, self.live.ciphertext)
+            return
+        
+        start, stop, replacement = self.live.update(text)
+        if stop == start and not replacement:
+            return
+        self._writing = True
+        box = self.ciphertext_box
+        box.delete(f'1.0 + {start} chars', f'1.0 + {stop} chars')
+        box.insert(f'1.0 + {start} chars', replacement)
+        box.edit_modified(False)
+        self._writing = False
     
     def log_message(self, message):
         """Add a message to the process log."""
-        self.process_log.insert(tk.END, message + "\n")
-        self.process_log.see(tk.END)
+        self.process_log.append(message)
+    
+    def export_log(self):
+        """Save the full process log to a text file."""
+        path = filedialog.asksaveasfilename(
+            title="Export Log",
+            defaultextension='.txt',
+            filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        
+        try:
+            count = self.process_log.log.export(path)
+            self.status_label.config(text=f"Exported {count:,} log lines to {path}")
+        except OSError as e:
+            messagebox.showerror("Error", f"Export failed: {str(e)}")
 
 
 def launch():
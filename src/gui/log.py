@@ -0,0 +1,116 @@
+"""
+PlayFair Cipher - Process Log
+A view of the process log that renders only the rows currently visible. The
+lines themselves are held by a TraceLog (see trace.py).
+"""
+
+import tkinter as tk
+import tkinter.font as tkfont
+from typing import Callable, Optional
+
+from .trace import TraceLog
+
+
+# Longer lines are cut short on screen (they are exported in full)
+MAX_WIDTH = 2000
+
+
+class LogView(tk.Frame):
+    """Read-only view of a TraceLog that renders only its visible rows."""
+    
+    def __init__(self, parent, log: Optional[TraceLog] = None, **text_options):
+        """
+        Args:
+            parent: Parent widget
+            log: Log to show (default: a new empty one)
+            text_options: Options for the underlying Text widget (font, bg, height, ...)
+        """
+        super().__init__(parent)
+        self.log = log if log is not None else TraceLog()
+        self.top = 0
+        self.selected = None
+        self.on_select: Optional[Callable[[int], None]] = None
+        
+        self.text = tk.Text(self, wrap=tk.NONE, cursor='arrow', **text_options)
+        self.scrollbar = tk.Scrollbar(self, orient=tk.VERTICAL, command=self._scroll)
+        self.xscrollbar = tk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.text.xview)
+        self.text.config(xscrollcommand=self.xscrollbar.set, state=tk.DISABLED)
+        self.text.tag_config('selected', background='#d6eaf8')
+        
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.xscrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        self._linespace = tkfont.Font(font=self.text['font']).metrics('linespace')
+        self.text.bind('<Configure>', lambda event: self.render())
+        self.text.bind('<MouseWheel>', self._wheel)
+        self.text.bind('<Button-4>', lambda event: self._scroll('scroll', -3, 'units'))
+        self.text.bind('<Button-5>', lambda event: self._scroll('scroll', 3, 'units'))
+        self.text.bind('<Button-1>', self._click)
+    
+    def rows(self) -> int:
+        """Number of lines that fit in the widget."""
+        height = self.text.winfo_height()
+        if height <= 1:
+            return int(self.text['height'])
+        return max(1, height // self._linespace)
+    
+    def clear(self) -> None:
+        """Empty the log."""
+        self.log.clear()
+        self.top = 0
+        self.selected = None
+        self.render()
+    
+    def append(self, message: str) -> None:
+        """Add a message and scroll to the end."""
+        self.log.append(message)
+        self.see_end()
+    
+    def see_end(self) -> None:
+        """Scroll so the last line is visible."""
+        self.top = max(0, len(self.log) - self.rows())
+        self.render()
+    
+    def render(self) -> None:
+        """Redraw the visible window of lines."""
+        rows = self.rows()
+        total = len(self.log)
+        self.top = max(0, min(self.top, total - rows))
+        lines = self.log.lines(self.top, self.top + rows + 1)
+        lines = [line if len(line) <= MAX_WIDTH else line[:MAX_WIDTH] + " …" for line in lines]
+        
+        self.text.config(state=tk.NORMAL)
+        self.text.delete('1.0', tk.END)
+        self.text.insert('1.0', '\n'.join(lines))
+        if self.selected is not None and 0 <= self.selected - self.top < len(lines):
+            row = self.selected - self.top + 1
+            self.text.tag_add('selected', f'{row}.0', f'{row}.end')
+        self.text.config(state=tk.DISABLED)
+        
+        if total:
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + rows) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+    
+    def _scroll(self, action, amount, unit=None) -> None:
+        """Handle scrollbar commands ('moveto', fraction / 'scroll', n, units|pages)."""
+        if action == 'moveto':
+            self.top = int(float(amount) * len(self.log))
+        else:
+            step = self.rows() if unit == 'pages' else 1
+            self.top += int(amount) * step
+        self.render()
+    
+    def _wheel(self, event) -> str:
+        self._scroll('scroll', -3 if event.delta > 0 else 3, 'units')
+        return 'break'
+    
+    def _click(self, event) -> str:
+        row = int(self.text.index(f'@{event.x},{event.y}').split('.')[0]) - 1
+        if self.top + row < len(self.log):
+            self.selected = self.top + row
+            self.render()
+            if self.on_select is not None:
+                self.on_select(self.selected)
+        return 'break'
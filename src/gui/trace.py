@@ -0,0 +1,126 @@
+"""
+PlayFair Cipher - Process Log Model
+The lines of the process log, kept in memory without any Tk dependency.
+
+A transform's digraph steps are not stored as lines at all: the log keeps
+the input and output strings and formats step i when it is displayed or
+exported, so adding a trace of any length is constant time.
+"""
+
+from bisect import bisect_right
+from itertools import accumulate
+from typing import List, Optional, Tuple
+
+
+# Steps formatted per write when exporting
+EXPORT_BLOCK = 1 << 14
+
+
+class Steps:
+    """Digraph step lines of a transform, formatted on demand."""
+    
+    __slots__ = ('source', 'output')
+    
+    def __init__(self, source: str, output: str):
+        """
+        Args:
+            source: Prepared input (even length)
+            output: Transformed input, same length as source
+        """
+        self.source = source
+        self.output = output
+    
+    def __len__(self) -> int:
+        return len(self.source) // 2
+    
+    def __getitem__(self, index: int) -> str:
+        i = 2 * index
+        return f"{self.source[i:i+2]} → {self.output[i:i+2]}"
+    
+    def lines(self, start: int, stop: int) -> List[str]:
+        """Return step lines start to stop."""
+        source, output = self.source, self.output
+        return [f"{source[i:i+2]} → {output[i:i+2]}" for i in range(2 * start, 2 * stop, 2)]
+
+
+class TraceLog:
+    """Lines of the process log, stored as plain-line segments and step segments."""
+    
+    def __init__(self):
+        self.clear()
+    
+    def clear(self) -> None:
+        """Remove every line."""
+        self._segments = []
+        self._offsets = [0]
+    
+    def __len__(self) -> int:
+        return self._offsets[-1]
+    
+    def _reindex(self) -> None:
+        self._offsets = [0] + list(accumulate(map(len, self._segments)))
+    
+    def append(self, message: str) -> None:
+        """Add a message; like a Text insert of message + newline."""
+        if self._segments and isinstance(self._segments[-1], list):
+            self._segments[-1].extend(message.split('\n'))
+        else:
+            self._segments.append(message.split('\n'))
+        self._reindex()
+    
+    def add_steps(self, source: str, output: str) -> None:
+        """Add one step line per digraph of a transform."""
+        self._segments.append(Steps(source, output))
+        self._reindex()
+    
+    def segment_at(self, index: int):
+        """
+        Locate a line.
+        
+        Returns:
+            The segment holding line index and the line's offset within it
+        """
+        position = bisect_right(self._offsets, index) - 1
+        return self._segments[position], index - self._offsets[position]
+    
+    def step_at(self, index: int) -> Optional[Tuple[str, str]]:
+        """Return the (input, output) digraphs of a step line, or None for other lines."""
+        if not 0 <= index < len(self):
+            return None
+        segment, offset = self.segment_at(index)
+        if not isinstance(segment, Steps):
+            return None
+        i = 2 * offset
+        return segment.source[i:i+2], segment.output[i:i+2]
+    
+    def lines(self, start: int, stop: int) -> List[str]:
+        """Return lines start to stop (clamped to the log)."""
+        start = max(0, start)
+        stop = min(stop, len(self))
+        result = []
+        while start < stop:
+            segment, offset = self.segment_at(start)
+            count = min(len(segment) - offset, stop - start)
+            if isinstance(segment, Steps):
+                result.extend(segment.lines(offset, offset + count))
+            else:
+                result.extend(segment[offset:offset + count])
+            start += count
+        return result
+    
+    def export(self, path: str) -> int:
+        """
+        Write every line to a UTF-8 text file.
+        
+        Returns:
+            Number of lines written
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            for segment in self._segments:
+                if isinstance(segment, Steps):
+                    for start in range(0, len(segment), EXPORT_BLOCK):
+                        stop = min(start + EXPORT_BLOCK, len(segment))
+                        f.write('\n'.join(segment.lines(start, stop)) + '\n')
+                else:
+                    f.write('\n'.join(segment) + '\n')
+        return len(self)
@@ -0,0 +1,250 @@
+"""
+PlayFair Cipher - Background GUI Jobs
+Runs cipher work on a worker thread so the Tk event loop stays responsive.
+
+Tk widgets may only be used from the main thread, so the worker never calls
+back into the GUI: it publishes progress and its result on the job, and the
+main thread picks them up by polling with root.after.
+"""
+
+import os
+import threading
+import time
+from collections import namedtuple
+from typing import Callable, Optional
+
+from ..stream import READ_SIZE, read_text
+
+
+# Milliseconds between polls of a running job
+POLL_INTERVAL = 50
+
+# Characters transformed per step; progress and cancellation are per step
+CHUNK_SIZE = 1 << 16
+
+# Characters kept from each end of a file for display
+PREVIEW_SIZE = 2000
+
+Transcript = namedtuple('Transcript', ['source', 'output'])
+FileTranscript = namedtuple('FileTranscript', ['source', 'output', 'source_bytes', 'output_bytes'])
+
+
+class JobCancelled(Exception):
+    """Raised on the worker thread when its job has been cancelled."""
+
+
+class BackgroundJob:
+    """Callable run on a worker thread, with results marshalled back via root.after."""
+    
+    def __init__(self, root, work: Callable, on_done: Callable,
+                 on_error: Optional[Callable] = None, on_progress: Optional[Callable] = None,
+                 on_cancel: Optional[Callable] = None, interval: int = POLL_INTERVAL,
+                 unit: str = 'characters'):
+        """
+        Args:
+            root: Tk root (anything with an after() method)
+            work: Called as work(job) on the worker thread; returns the result
+            on_done: Called with the result on the main thread
+            on_error: Called with the exception on the main thread
+            on_progress: Called with the job on the main thread at each poll
+            on_cancel: Called on the main thread once a cancelled job stops
+            interval: Milliseconds between polls
+            unit: What done and total count, for display
+        """
+        self.root = root
+        self.work = work
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.on_cancel = on_cancel
+        self.interval = interval
+        self.unit = unit
+        
+        self.done = 0
+        self.total = 0
+        self.started = None
+        self._cancelled = threading.Event()
+        self._stopped = False
+        self._finished = False
+        self._result = None
+        self._error = None
+        self._thread = None
+    
+    @property
+    def running(self) -> bool:
+        """Whether the job has started and its callbacks have not yet run."""
+        return self._thread is not None and not self._finished
+    
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancel() has been called."""
+        return self._cancelled.is_set()
+    
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the job started."""
+        return time.perf_counter() - self.started if self.started is not None else 0.0
+    
+    @property
+    def rate(self) -> float:
+        """Units of work completed per second."""
+        elapsed = self.elapsed
+        return self.done / elapsed if elapsed > 0 else 0.0
+    
+    def start(self) -> 'BackgroundJob':
+        """Start the worker thread and begin polling."""
+        self.started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self.root.after(self.interval, self._poll)
+        return self
+    
+    def cancel(self) -> None:
+        """Ask the worker to stop at its next progress report."""
+        self._cancelled.set()
+    
+    def report(self, done: int, total: int) -> None:
+        """
+        Record progress (worker thread).
+        
+        Raises:
+            JobCancelled: If the job has been cancelled
+        """
+        self.done = done
+        self.total = total
+        if self._cancelled.is_set():
+            raise JobCancelled()
+    
+    def _run(self) -> None:
+        try:
+            self._result = self.work(self)
+        except JobCancelled:
+            pass
+        except Exception as e:
+            self._error = e
+        self._stopped = True
+    
+    def _poll(self) -> None:
+        if not self._stopped:
+            if self.on_progress is not None:
+                self.on_progress(self)
+            self.root.after(self.interval, self._poll)
+            return
+        
+        self._finished = True
+        if self._cancelled.is_set():
+            if self.on_cancel is not None:
+                self.on_cancel()
+        elif self._error is not None:
+            if self.on_error is not None:
+                self.on_error(self._error)
+        else:
+            self.on_done(self._result)
+
+
+def transform(job: BackgroundJob, cipher, text: str, mode: str,
+              chunk_size: int = CHUNK_SIZE) -> Transcript:
+    """
+    Encrypt or decrypt text in chunks, reporting progress on job.
+    
+    Args:
+        job: Job to report progress to
+        cipher: PlayFairEngine instance
+        text: Plaintext (encrypt) or ciphertext (decrypt)
+        mode: 'encrypt' or 'decrypt'
+        chunk_size: Characters per step (rounded down to an even number)
+    
+    Returns:
+        Prepared (or cleaned) input and the output
+    """
+    if mode == 'encrypt':
+        source = cipher._prepare(text)
+    else:
+        source = cipher._clean(text)
+        source = source[:len(source) - len(source) % 2]
+    
+    chunk_size = max(2, chunk_size - chunk_size % 2)
+    pieces = []
+    job.report(0, len(source))
+    for start in range(0, len(source), chunk_size):
+        chunk = source[start:start + chunk_size]
+        pieces.append(cipher._apply_tables(chunk, mode=mode))
+        job.report(start + len(chunk), len(source))
+    return Transcript(source, ''.join(pieces))
+
+
+class Preview:
+    """First and last characters of a stream of text."""
+    
+    def __init__(self, size: int = PREVIEW_SIZE):
+        self.size = size
+        self.head = ''
+        self.tail = ''
+        self.chars = 0
+    
+    def add(self, text: str) -> None:
+        """Account for the next piece of the stream."""
+        self.chars += len(text)
+        room = self.size - len(self.head)
+        if room > 0:
+            self.head += text[:room]
+            text = text[room:]
+        if text:
+            self.tail = (self.tail + text)[-self.size:]
+    
+    def render(self) -> str:
+        """The whole text if it was short, otherwise its head and tail."""
+        omitted = self.chars - len(self.head) - len(self.tail)
+        if not omitted:
+            return self.head + self.tail
+        return f"{self.head}\n\n[... {omitted:,} characters not shown ...]\n\n{self.tail}"
+
+
+def transform_file(job: BackgroundJob, cipher, src: str, dst: str, mode: str,
+                   chunk_size: int = READ_SIZE) -> FileTranscript:
+    """
+    Encrypt or decrypt the file src into dst in chunks, reporting bytes read.
+    
+    Only a preview of each side is kept in memory. A cancelled or failed
+    run removes the partial dst.
+    
+    Args:
+        job: Job to report progress to
+        cipher: PlayFairEngine instance
+        src: Input file (UTF-8 text)
+        dst: Output file
+        mode: 'encrypt' or 'decrypt'
+        chunk_size: Bytes read per step
+    
+    Returns:
+        Previews of input and output, and the size of each in bytes
+    
+    Raises:
+        ValueError: If src and dst are the same file
+    """
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise ValueError("The output file must differ from the input file")
+    
+    total = os.path.getsize(src)
+    transformer = cipher.encryptor() if mode == 'encrypt' else cipher.decryptor()
+    source_preview = Preview()
+    output_preview = Preview()
+    written = 0
+    with open(src, 'rb') as source, open(dst, 'wb') as target:
+        try:
+            job.report(0, total)
+            for text in read_text(source, chunk_size):
+                source_preview.add(text)
+                output = transformer.update(text)
+                output_preview.add(output)
+                written += target.write(output.encode('utf-8'))
+                job.report(source.tell(), total)
+            
+            output = transformer.finalize()
+            output_preview.add(output)
+            written += target.write(output.encode('utf-8'))
+        except BaseException:
+            target.close()
+            os.remove(dst)
+            raise
+    return FileTranscript(source_preview, output_preview, total, written)
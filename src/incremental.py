@@ -0,0 +1,157 @@
+"""
+PlayFair Cipher Incremental Preparation
+Keeps prepared text and ciphertext up to date while the plaintext is edited.
+
+Clean position i lands at prepared offset i + (pads before i), so storing
+the sorted pad positions gives the digraph boundary of every position with
+one bisect. After an edit, pairing is replayed from the digraph holding the
+last unchanged character up to the first point where the new pairing and
+the previous one both begin a digraph on the same unchanged text. Past that
+point the pairing is the same as before, only shifted.
+
+Two pairings that disagree on the unchanged text agree again right after
+its next repeated character: whichever pairing starts a digraph there pads
+it, and the other one ends a digraph there. So the replay is short unless
+the edit is followed by a long run without doubled letters.
+"""
+
+from bisect import bisect_left
+from typing import List, Tuple
+
+from .pairing import _REPEAT, pad_positions
+
+
+def _common_prefix(a: str, b: str) -> int:
+    """Length of the common prefix of a and b, by bisection over slices."""
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[low:mid] == b[low:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _common_suffix(a: str, b: str, limit: int) -> int:
+    """Length of the common suffix of a and b, at most limit."""
+    low, high = 0, limit
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[len(a) - mid:len(a) - low] == b[len(b) - mid:len(b) - low]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+class IncrementalPreparation:
+    """Prepared text that tracks edits to its source text."""
+    
+    def __init__(self, cipher, text: str = ''):
+        """
+        Args:
+            cipher: PlayFairEngine instance
+            text: Initial text
+        """
+        self.cipher = cipher
+        self.clean = cipher._clean(text)
+        self.pads = pad_positions(self.clean)
+        self.prepared = self._build(self.clean, 0, len(self.clean), self.pads)
+    
+    def _build(self, text: str, start: int, stop: int, pads: List[int]) -> str:
+        """Prepared form of text[start:stop], given its pad positions."""
+        parts = []
+        for pos in pads:
+            parts.append(text[start:pos + 1])
+            parts.append(self.cipher.PAD)
+            start = pos + 1
+        parts.append(text[start:stop])
+        return ''.join(parts)
+    
+    def offset(self, index: int) -> int:
+        """Prepared offset of clean position index (len(prepared) at the end)."""
+        return index + bisect_left(self.pads, index)
+    
+    def digraph_at(self, index: int) -> int:
+        """Index of the digraph holding clean position index."""
+        return self.offset(index) // 2
+    
+    def digraphs(self) -> List[str]:
+        """Current digraphs, as returned by _prepare_text()."""
+        return self.cipher._codec.digraphs(self.cipher._codec.encode(self.prepared))
+    
+    def update(self, text: str) -> Tuple[int, int, str]:
+        """
+        Replace the source text and re-pair only what the edit affects.
+        
+        Args:
+            text: New full text
+        
+        Returns:
+            (start, stop, segment): prepared[start:stop] of the previous
+            text was replaced by segment; start and stop are even
+        """
+        old, new = self.clean, self.cipher._clean(text)
+        prefix = _common_prefix(old, new)
+        if prefix == len(old) == len(new):
+            return len(self.prepared), len(self.prepared), ''
+        suffix = _common_suffix(old, new, min(len(old), len(new)) - prefix)
+        shift = len(old) - len(new)
+        
+        # Restart at the digraph holding the last unchanged character: its
+        # pad depends on the character after it
+        start = max(0, prefix - 1)
+        if self.offset(start) % 2:
+            start -= 1
+        
+        end = len(new) - suffix
+        pads = pad_positions(new, start, end)
+        anchor = pads[-1] + 1 if pads else start
+        if end < len(new):
+            starts = (end - anchor) % 2 == 0
+            if starts != (self.offset(end + shift) % 2 == 0):
+                # Misaligned until the next repeat, after which both agree
+                match = _REPEAT.search(new, end)
+                stop = match.start() + 1 if match else len(new)
+            else:
+                # Aligned; finish the digraph if end is inside one
+                stop = end if starts else end + 1
+            pads += pad_positions(new, anchor, stop)
+            end = stop
+        
+        first = bisect_left(self.pads, start)
+        last = bisect_left(self.pads, end + shift)
+        removed = (self.offset(start), self.offset(end + shift))
+        segment = self._build(new, start, end, pads)
+        
+        self.clean = new
+        self.pads[first:] = pads + [pos - shift for pos in self.pads[last:]]
+        self.prepared = self.prepared[:removed[0]] + segment + self.prepared[removed[1]:]
+        return removed[0], removed[1], segment
+
+
+class LiveEncryption:
+    """Ciphertext that tracks edits to its plaintext."""
+    
+    def __init__(self, cipher, text: str = ''):
+        """
+        Args:
+            cipher: PlayFairEngine instance
+            text: Initial plaintext
+        """
+        self.preparation = IncrementalPreparation(cipher, text)
+        self.ciphertext = cipher._apply_tables(self.preparation.prepared, mode='encrypt')
+    
+    def update(self, text: str) -> Tuple[int, int, str]:
+        """
+        Re-encrypt the digraphs affected by changing the plaintext to text.
+        
+        Returns:
+            (start, stop, replacement): ciphertext[start:stop] of the previous
+            plaintext was replaced by replacement
+        """
+        start, stop, segment = self.preparation.update(text)
+        replacement = self.preparation.cipher._apply_tables(segment, mode='encrypt')
+        self.ciphertext = self.ciphertext[:start] + replacement + self.ciphertext[stop:]
+        return start, stop, replacement
@@ -0,0 +1,89 @@
+"""
+PlayFair Text Normalization
+Precompiled tables that uppercase, apply substitutions (such as J → I) and
+drop characters outside the cipher alphabet in a single C-level pass.
+"""
+
+from typing import Dict
+
+
+class _FoldTable(dict):
+    """str.translate mapping that resolves each new code point on first use."""
+    
+    def __init__(self, resolve):
+        super().__init__()
+        self._resolve = resolve
+    
+    def __missing__(self, code: int) -> str:
+        value = self._resolve(chr(code))
+        self[code] = value
+        return value
+
+
+class Normalizer:
+    """
+    Cleans text for one cipher configuration.
+    
+    ASCII alphabets use a 256-byte translate table plus a delete set, so the
+    whole job is one bytes.translate() call; input that is already clean is
+    returned unchanged. Other alphabets use a lazily filled str.translate map.
+    """
+    
+    def __init__(self, alphabet: str, substitutions: Dict[str, str], case_fold: bool = True):
+        """
+        Args:
+            alphabet: Characters kept after normalization
+            substitutions: Characters folded onto alphabet characters
+            case_fold: Uppercase text before substitution
+        """
+        self.alphabet = frozenset(alphabet)
+        self.case_fold = case_fold
+        self._substitute = str.maketrans(substitutions)
+        self._table = _FoldTable(self._resolve)
+        
+        self.translate = None
+        self.delete = None
+        if alphabet.isascii() and all(k.isascii() and v.isascii() for k, v in substitutions.items()):
+            translate = bytearray(range(256))
+            delete = bytearray(range(128, 256))
+            for byte in range(128):
+                cleaned = self._resolve(chr(byte))
+                if cleaned:
+                    translate[byte] = ord(cleaned)
+                else:
+                    delete.append(byte)
+            self.translate = bytes(translate)
+            self.delete = bytes(delete)
+    
+    def _resolve(self, char: str) -> str:
+        """Normalize a single character the slow way ('' if dropped)."""
+        if self.case_fold:
+            char = char.upper()
+        char = char.translate(self._substitute)
+        return ''.join([c for c in char if c in self.alphabet])
+    
+    def clean(self, text: str) -> str:
+        """
+        Uppercase, substitute and drop non-alphabet characters.
+        
+        Returns:
+            Text containing only alphabet characters
+        """
+        if self.translate is None:
+            return text.translate(self._table)
+        
+        if text.isascii():
+            data = text.encode('ascii')
+            cleaned = data.translate(self.translate, self.delete)
+            # Already clean: reuse the original string
+            return text if cleaned == data else cleaned.decode('ascii')
+        
+        # Only ASCII can survive, but uppercasing may turn e.g. 'ı' into 'I'
+        if self.case_fold:
+            text = text.upper()
+        data = text.encode('ascii', 'ignore')
+        return data.translate(self.translate, self.delete).decode('ascii')
+    
+    def clean_bytes(self, data) -> bytes:
+        """Clean ASCII-encoded bytes; non-ASCII bytes are dropped."""
+        return bytes(data).translate(self.translate, self.delete)
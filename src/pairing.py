@@ -0,0 +1,104 @@
+"""
+PlayFair Digraph Pairing
+Splits cleaned text into digraphs, inserting a filler between repeated
+characters. Only positions where a character repeats are visited in Python;
+everything in between is copied as whole slices.
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+
+PAD = 'X'
+
+_REPEAT = re.compile(r'(.)(?=\1)', re.DOTALL)
+
+
+def pair(text: str, pad: str = PAD) -> Tuple[str, str]:
+    """
+    Pair cleaned text into digraphs without padding the end.
+    
+    Args:
+        text: Cleaned text (alphabet characters only)
+        pad: Character inserted between duplicates
+        
+    Returns:
+        Even-length prepared text and the trailing unpaired character ('' if none)
+    """
+    parts = []
+    start = 0
+    for match in _REPEAT.finditer(text):
+        pos = match.start()
+        # A repeat only needs filler when it would fall inside one digraph
+        if (pos - start) % 2 == 0:
+            parts.append(text[start:pos + 1])
+            parts.append(pad)
+            start = pos + 1
+    
+    if (len(text) - start) % 2:
+        parts.append(text[start:-1])
+        return ''.join(parts), text[-1]
+    
+    parts.append(text[start:])
+    return ''.join(parts), ''
+
+
+def align_cuts(text: str, cuts: List[int]) -> List[int]:
+    """
+    Move split positions so that each one starts a digraph.
+    
+    Pairing is decided left to right, so whether a position starts a digraph
+    depends on every repeat before it. This replays only the repeat positions
+    (without building any output) and pulls a cut back by one character when
+    it would fall inside a digraph. Text split at the returned positions can
+    then be prepared piece by piece with the same result as a single pass.
+    
+    Args:
+        text: Cleaned text
+        cuts: Increasing split positions
+        
+    Returns:
+        Adjusted split positions
+    """
+    aligned = []
+    start = 0
+    repeats = (match.start() for match in _REPEAT.finditer(text))
+    pos = next(repeats, None)
+    for cut in cuts:
+        while pos is not None and pos < cut:
+            if (pos - start) % 2 == 0:
+                start = pos + 1
+            pos = next(repeats, None)
+        aligned.append(cut if (cut - start) % 2 == 0 else cut - 1)
+    return aligned
+
+
+def pad_positions(text: str, start: int = 0, stop: Optional[int] = None) -> List[int]:
+    """
+    Return the positions in text[start:stop] that are followed by a pad.
+    
+    A position gets a pad when it begins a digraph and the next character
+    repeats it, or when it is left unpaired at the very end of text. Pairing
+    is replayed from start, which must begin a digraph.
+    
+    Args:
+        text: Cleaned text
+        start: Position that begins a digraph
+        stop: End of the range (default: end of text)
+        
+    Returns:
+        Increasing positions, each followed by a pad in the prepared text
+    """
+    stop = len(text) if stop is None else stop
+    pads = []
+    anchor = start
+    # One character past stop, so a repeat straddling stop is still seen
+    for match in _REPEAT.finditer(text, start, min(stop + 1, len(text))):
+        pos = match.start()
+        if (pos - anchor) % 2 == 0:
+            pads.append(pos)
+            anchor = pos + 1
+    
+    if stop == len(text) and (stop - anchor) % 2:
+        pads.append(stop - 1)
+    return pads
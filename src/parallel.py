@@ -0,0 +1,165 @@
+"""
+PlayFair Cipher Parallel Processing
+Fans large encryption and decryption jobs out to worker processes.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Optional
+
+from .pairing import align_cuts
+
+
+# Inputs shorter than this are processed in the calling process
+MIN_PARALLEL_LENGTH = 1 << 20
+
+# Smallest number of cleaned characters handed to a worker per task
+CHUNK_SIZE = 1 << 18
+
+_worker_cipher = None
+
+
+def _init_worker(cipher_class, key: str) -> None:
+    """Build the cipher once per worker process."""
+    global _worker_cipher
+    _worker_cipher = cipher_class(key)
+
+
+def _encrypt_piece(piece: str) -> str:
+    """Encrypt one digraph-aligned piece in a worker."""
+    return _worker_cipher.encrypt(piece)
+
+
+def _decrypt_piece(piece: str) -> str:
+    """Decrypt one even-length piece in a worker."""
+    return _worker_cipher.decrypt(piece)
+
+
+def _resolve_workers(workers: Optional[int]) -> int:
+    """Default to one worker per CPU."""
+    return workers if workers else (os.cpu_count() or 1)
+
+
+def _chunk_size(length: int, workers: int) -> int:
+    """Even piece size giving each worker a few tasks."""
+    size = max(CHUNK_SIZE, -(-length // (workers * 4)))
+    return size + size % 2
+
+
+def split_even(text: str, workers: int) -> List[str]:
+    """
+    Split text into even-length pieces, a few per worker.
+    
+    Returns:
+        Pieces whose concatenation is text; only the last may be odd
+    """
+    size = _chunk_size(len(text), workers)
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def split_aligned(text: str, workers: int) -> List[str]:
+    """
+    Split cleaned plaintext at digraph boundaries, a few pieces per worker.
+    
+    Returns:
+        Pieces whose concatenation is text and which can be encrypted
+        independently
+    """
+    size = _chunk_size(len(text), workers)
+    bounds = [0] + align_cuts(text, list(range(size, len(text), size))) + [len(text)]
+    return [text[a:b] for a, b in zip(bounds, bounds[1:])]
+
+
+def encrypt_parallel(cipher, plaintext: str, workers: Optional[int] = None) -> str:
+    """
+    Encrypt plaintext across a pool of processes.
+    
+    Works in two phases: a scan over repeated characters fixes the digraph
+    alignment at each piece boundary, then the pieces are encrypted
+    independently with cipher.encrypt() and joined in order.
+    
+    Args:
+        cipher: PlayFairEngine instance (e.g. PlayFairCipher)
+        plaintext: Text to encrypt
+        workers: Number of processes (default: CPU count)
+    
+    Returns:
+        Same result as cipher.encrypt(plaintext)
+    """
+    text = cipher._clean(plaintext)
+    workers = _resolve_workers(workers)
+    
+    if workers <= 1 or len(text) < MIN_PARALLEL_LENGTH:
+        return cipher.encrypt(text)
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(type(cipher), cipher.key)) as pool:
+        return ''.join(pool.map(_encrypt_piece, split_aligned(text, workers)))
+
+
+def decrypt_parallel(cipher, ciphertext: str, workers: Optional[int] = None) -> str:
+    """
+    Decrypt ciphertext across a pool of processes.
+    
+    Digraphs are independent once the cleaned text is split at even offsets,
+    so each piece is decrypted with cipher.decrypt() in a worker and the
+    results are joined in order.
+    
+    Args:
+        cipher: PlayFairEngine instance (e.g. PlayFairCipher)
+        ciphertext: Text to decrypt
+        workers: Number of processes (default: CPU count)
+    
+    Returns:
+        Same result as cipher.decrypt(ciphertext)
+    """
+    text = cipher._clean(ciphertext)
+    text = text[:len(text) - len(text) % 2]
+    workers = _resolve_workers(workers)
+    
+    if workers <= 1 or len(text) < MIN_PARALLEL_LENGTH:
+        return cipher._apply_tables(text, mode='decrypt')
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(type(cipher), cipher.key)) as pool:
+        return ''.join(pool.map(_decrypt_piece, split_even(text, workers)))
+
+
+def iter_decrypt_parallel(cipher, chunks: Iterable[str], workers: Optional[int] = None) -> Iterator[str]:
+    """
+    Decrypt a stream of ciphertext chunks across a pool of processes.
+    
+    Chunks are cleaned and cut at even offsets in the calling process, and at
+    most two pieces per worker are in flight, so memory use stays bounded
+    however long the stream is.
+    
+    Args:
+        cipher: PlayFairEngine instance (e.g. PlayFairCipher)
+        chunks: Ciphertext pieces, e.g. blocks of a file
+        workers: Number of processes (default: CPU count)
+    
+    Yields:
+        Plaintext pieces in order; joined they equal cipher.decrypt() of the
+        joined chunks
+    """
+    workers = _resolve_workers(workers)
+    if workers <= 1:
+        yield from cipher.iter_decrypt(chunks)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(type(cipher), cipher.key)) as pool:
+        in_flight = deque()
+        pending = ''
+        for chunk in chunks:
+            text = pending + cipher._clean(chunk)
+            cut = len(text) - len(text) % 2
+            pending = text[cut:]
+            if cut:
+                in_flight.append(pool.submit(_decrypt_piece, text[:cut]))
+            if len(in_flight) >= 2 * workers:
+                yield in_flight.popleft().result()
+        
+        while in_flight:
+            yield in_flight.popleft().result()
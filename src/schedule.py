@@ -0,0 +1,108 @@
+"""
+PlayFair Key Schedule Cache
+Process-wide LRU cache of per-key matrices and digraph tables, shared by
+every cipher class so that repeated keys are only expanded once.
+"""
+
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Callable, Hashable
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class KeySchedule:
+    """
+    Everything derived from a key.
+    
+    Schedules are shared between cipher instances and must not be modified.
+    cells is the matrix as flat codes in row order and positions its inverse
+    (code -> cell index), SIZE * SIZE bytes each. The digraph tables (see
+    Codec) and their NumPy and byte-level forms are filled in once, on first
+    use, so keys that are kept resident but rarely used stay small.
+    """
+    
+    __slots__ = ('cells', 'positions', 'tables', 'vector', 'bytes')
+    
+    def __init__(self, cells: bytes, positions: bytes):
+        self.cells = cells
+        self.positions = positions
+        self.tables = None
+        self.vector = None
+        self.bytes = None
+
+
+class ScheduleCache:
+    """Thread-safe, bounded LRU mapping of cache keys to key schedules."""
+    
+    def __init__(self, maxsize: int = 1024):
+        """
+        Args:
+            maxsize: Most schedules kept; 0 disables caching
+        """
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+    
+    @property
+    def maxsize(self) -> int:
+        """Most schedules kept; lowering it evicts the oldest entries."""
+        return self._maxsize
+    
+    @maxsize.setter
+    def maxsize(self, value: int) -> None:
+        if value < 0:
+            raise ValueError("maxsize must not be negative")
+        with self._lock:
+            self._maxsize = value
+            self._evict()
+    
+    def get(self, key: Hashable, build: Callable[[], KeySchedule]) -> KeySchedule:
+        """
+        Return the cached schedule for key, building and storing it on a miss.
+        
+        Args:
+            key: Cache key, e.g. (cipher class, normalized keyword)
+            build: Called without arguments to create a missing schedule
+        """
+        with self._lock:
+            schedule = self._entries.get(key)
+            if schedule is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return schedule
+            self.misses += 1
+        
+        schedule = build()
+        with self._lock:
+            self._entries[key] = schedule
+            self._entries.move_to_end(key)
+            self._evict()
+        return schedule
+    
+    def _evict(self) -> None:
+        """Drop least recently used entries beyond maxsize (lock held)."""
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop every cached schedule and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def info(self) -> CacheInfo:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self._maxsize, len(self._entries))
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared by every PlayFairEngine subclass
+schedule_cache = ScheduleCache()
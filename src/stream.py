@@ -0,0 +1,177 @@
+"""
+PlayFair Cipher Streaming
+Incremental encryption and decryption over chunked input with constant memory.
+"""
+
+import codecs
+from functools import partial
+from typing import BinaryIO, Iterable, Iterator
+
+from .pairing import pair
+
+
+# Bytes read from a binary stream per step
+READ_SIZE = 1 << 20
+
+
+class Encryptor:
+    """
+    Encrypt text supplied in chunks.
+    
+    The unpaired trailing character and duplicate-letter state are carried
+    across chunk boundaries, so the joined output of update() and finalize()
+    is identical to cipher.encrypt() on the joined input.
+    """
+    
+    def __init__(self, cipher):
+        """
+        Args:
+            cipher: PlayFairEngine instance (e.g. PlayFairCipher)
+        """
+        self._cipher = cipher
+        self._pending = ''
+        self._finalized = False
+    
+    def update(self, chunk: str) -> str:
+        """
+        Encrypt the next chunk of plaintext.
+        
+        Returns:
+            Ciphertext for every digraph completed so far
+        
+        Raises:
+            ValueError: If the encryptor was already finalized
+        """
+        if self._finalized:
+            raise ValueError("Encryptor already finalized")
+        
+        prepared, self._pending = pair(self._pending + self._cipher._clean(chunk), self._cipher.PAD)
+        return self._cipher._apply_tables(prepared, mode='encrypt')
+    
+    def finalize(self) -> str:
+        """
+        Pad and encrypt the last unpaired character, if any.
+        
+        Returns:
+            Remaining ciphertext
+        """
+        if self._finalized:
+            raise ValueError("Encryptor already finalized")
+        
+        self._finalized = True
+        if not self._pending:
+            return ''
+        
+        last, self._pending = self._pending + self._cipher.PAD, ''
+        return self._cipher._apply_tables(last, mode='encrypt')
+
+
+class Decryptor:
+    """
+    Decrypt text supplied in chunks.
+    
+    At most one cleaned character is carried between chunks, so memory use
+    does not grow with the input. A trailing unpaired character is dropped,
+    matching cipher.decrypt().
+    """
+    
+    def __init__(self, cipher):
+        """
+        Args:
+            cipher: PlayFairEngine instance (e.g. PlayFairCipher)
+        """
+        self._cipher = cipher
+        self._pending = ''
+        self._finalized = False
+    
+    def update(self, chunk: str) -> str:
+        """
+        Decrypt the next chunk of ciphertext.
+        
+        Returns:
+            Plaintext for every digraph completed so far
+        
+        Raises:
+            ValueError: If the decryptor was already finalized
+        """
+        if self._finalized:
+            raise ValueError("Decryptor already finalized")
+        
+        text = self._pending + self._cipher._clean(chunk)
+        cut = len(text) - len(text) % 2
+        self._pending = text[cut:]
+        return self._cipher._apply_tables(text[:cut], mode='decrypt')
+    
+    def finalize(self) -> str:
+        """
+        Finish decryption, discarding an unpaired trailing character.
+        
+        Returns:
+            Remaining plaintext (always empty)
+        """
+        if self._finalized:
+            raise ValueError("Decryptor already finalized")
+        
+        self._finalized = True
+        self._pending = ''
+        return ''
+
+
+def iter_encrypt(cipher, chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Encrypt an iterable of plaintext chunks lazily.
+    
+    Args:
+        cipher: PlayFairEngine instance (e.g. PlayFairCipher)
+        chunks: Plaintext pieces, e.g. blocks of a file
+    
+    Yields:
+        Non-empty ciphertext pieces in order
+    """
+    encryptor = Encryptor(cipher)
+    for chunk in chunks:
+        ciphertext = encryptor.update(chunk)
+        if ciphertext:
+            yield ciphertext
+    
+    ciphertext = encryptor.finalize()
+    if ciphertext:
+        yield ciphertext
+
+
+def iter_decrypt(cipher, chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Decrypt an iterable of ciphertext chunks lazily.
+    
+    Args:
+        cipher: PlayFairEngine instance (e.g. PlayFairCipher)
+        chunks: Ciphertext pieces, e.g. lines of a file
+    
+    Yields:
+        Non-empty plaintext pieces in order
+    """
+    decryptor = Decryptor(cipher)
+    for chunk in chunks:
+        plaintext = decryptor.update(chunk)
+        if plaintext:
+            yield plaintext
+    
+    plaintext = decryptor.finalize()
+    if plaintext:
+        yield plaintext
+
+
+def read_text(source: BinaryIO, chunk_size: int = READ_SIZE) -> Iterator[str]:
+    """
+    Read a binary stream as UTF-8 text in chunks.
+    Characters split across chunk boundaries are decoded correctly.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    for block in iter(partial(source.read, chunk_size), b''):
+        text = decoder.decode(block)
+        if text:
+            yield text
+    
+    text = decoder.decode(b'', final=True)
+    if text:
+        yield text
@@ -0,0 +1,165 @@
+"""
+PlayFair Cipher Vectorized Backend
+Applies a cipher's digraph tables to whole texts with NumPy fancy indexing.
+NumPy is optional; without it the ciphers use their pure-Python path.
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Below this length the array setup costs more than the Python loop
+MIN_LENGTH = 4096
+
+# Code marking bytes that are not part of the cipher alphabet
+INVALID = 255
+
+
+def usable(text: str) -> bool:
+    """Return True if the NumPy backend can and should process text."""
+    return np is not None and len(text) >= MIN_LENGTH and text.isascii()
+
+
+def apply_table(table, codes: bytes, size: int) -> bytes:
+    """
+    Map even-length codes through a dense digraph table (see Codec).
+    
+    Args:
+        table: array('H') digraph table, used in place
+        codes: Even-length alphabet codes
+        size: Number of codes in the alphabet
+    
+    Returns:
+        Resulting codes
+    """
+    pairs = np.frombuffer(codes, dtype=np.uint8).reshape(-1, 2).astype(np.intp)
+    return np.frombuffer(table, dtype=np.uint16)[pairs[:, 0] * size + pairs[:, 1]].tobytes()
+
+
+class VectorTables:
+    """NumPy form of a cipher's normalization and digraph tables."""
+    
+    def __init__(self, cipher):
+        """
+        Build the lookup arrays for a cipher.
+        
+        Args:
+            cipher: PlayFairEngine instance (e.g. PlayFairCipher)
+        """
+        chars = [char for row in cipher.get_matrix() for char in row]
+        index = {char: i for i, char in enumerate(chars)}
+        self.size = len(chars)
+        
+        # Raw ASCII byte -> alphabet index, applying the cipher's own cleaning
+        self.codes = np.full(256, INVALID, dtype=np.uint8)
+        for byte in range(128):
+            cleaned = cipher._clean(chr(byte))
+            if cleaned:
+                self.codes[byte] = index[cleaned]
+        
+        self.encrypt = self._pack(cipher, chars, 'encrypt')
+        self.decrypt = self._pack(cipher, chars, 'decrypt')
+    
+    @staticmethod
+    def _pack(cipher, chars, mode):
+        """Pack a digraph table into a (size * size, 2) array of ASCII bytes."""
+        flat = ''.join(cipher._apply_rule(a, b, mode=mode) for a in chars for b in chars)
+        return np.frombuffer(flat.encode('ascii'), dtype=np.uint8).reshape(-1, 2)
+    
+    def clean(self, data) -> 'np.ndarray':
+        """
+        Map raw ASCII bytes to alphabet indices, dropping everything else.
+        
+        Args:
+            data: Bytes-like object or uint8 array
+        
+        Returns:
+            uint8 array of alphabet indices
+        """
+        codes = self.codes[np.frombuffer(data, dtype=np.uint8)]
+        return codes[codes != INVALID]
+    
+    def lookup(self, codes: 'np.ndarray', mode: str = 'encrypt') -> 'np.ndarray':
+        """
+        Apply the encrypt or decrypt table to an even-length index array.
+        
+        Returns:
+            Flat uint8 array of output ASCII bytes
+        """
+        pairs = codes.reshape(-1, 2).astype(np.intp)
+        index = pairs[:, 0] * self.size + pairs[:, 1]
+        
+        table = self.encrypt if mode == 'encrypt' else self.decrypt
+        return table[index].ravel()
+    
+    def apply(self, text: str, mode: str = 'encrypt') -> str:
+        """
+        Clean an ASCII text and apply the encrypt or decrypt table to it.
+        A trailing unpaired character is dropped.
+        
+        Args:
+            text: ASCII text; non-alphabet characters are ignored
+            mode: 'encrypt' or 'decrypt'
+        
+        Returns:
+            Transformed text
+        """
+        codes = self.clean(text.encode('ascii'))
+        codes = codes[:len(codes) - len(codes) % 2]
+        return self.lookup(codes, mode=mode).tobytes().decode('ascii')
+
+
+class FanOut:
+    """
+    One prepared text applied to the flat matrices of many keys at once.
+    
+    Only the distinct digraphs of the text are pushed through the PlayFair
+    rules, as (keys, digraphs) arrays, and then expanded back to the text.
+    """
+    
+    def __init__(self, codes: bytes, size: int):
+        """
+        Args:
+            codes: Even-length alphabet codes of the prepared text
+            size: Grid width of the cipher
+        """
+        self.size = size
+        cells = size * size
+        pairs = np.frombuffer(codes, dtype=np.uint8).reshape(-1, 2).astype(np.intp)
+        digraphs, self.inverse = np.unique(pairs[:, 0] * cells + pairs[:, 1], return_inverse=True)
+        self.first, self.second = np.divmod(digraphs, cells)
+    
+    def apply(self, cells: bytes, positions: bytes, mode: str = 'encrypt') -> 'np.ndarray':
+        """
+        Encrypt or decrypt the text under a block of keys.
+        
+        Args:
+            cells: Concatenated flat matrices of the keys (see KeySchedule)
+            positions: Concatenated inverse indexes, in the same order
+            mode: 'encrypt' or 'decrypt'
+        
+        Returns:
+            (keys, text length) uint8 array of output codes
+        """
+        size = self.size
+        shift = 1 if mode == 'encrypt' else -1
+        cells = np.frombuffer(cells, dtype=np.uint8).reshape(-1, size * size)
+        positions = np.frombuffer(positions, dtype=np.uint8).reshape(-1, size * size)
+        
+        row1, col1 = np.divmod(positions[:, self.first].astype(np.intp), size)
+        row2, col2 = np.divmod(positions[:, self.second].astype(np.intp), size)
+        same_row = row1 == row2
+        same_col = (col1 == col2) & ~same_row
+        rectangle = ~(same_row | same_col)
+        
+        new_col1 = np.where(same_row, (col1 + shift) % size, np.where(rectangle, col2, col1))
+        new_col2 = np.where(same_row, (col2 + shift) % size, np.where(rectangle, col1, col2))
+        new_row1 = np.where(same_col, (row1 + shift) % size, row1)
+        new_row2 = np.where(same_col, (row2 + shift) % size, row2)
+        
+        output = np.empty((len(cells), len(self.inverse), 2), dtype=np.uint8)
+        output[:, :, 0] = np.take_along_axis(cells, new_row1 * size + new_col1, axis=1)[:, self.inverse]
+        output[:, :, 1] = np.take_along_axis(cells, new_row2 * size + new_col2, axis=1)[:, self.inverse]
+        return output.reshape(len(cells), -1)
@@ -2,11 +2,27 @@
 PlayFair Cipher Test Suite
 """
 
+import argparse
+import io
+import json
 import sys
 import os
+import random
+import tempfile
+import time
+from contextlib import redirect_stdout
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from src.cipher import PlayFairCipher
+from src.engine import PlayFairEngine
+from src import parallel, vectorized
+from src.cli import jsonl, pipe, rotate
+from src.compose import ComposedCipher
+from src.incremental import IncrementalPreparation, LiveEncryption
+from src.gui.trace import TraceLog
+from src.gui.worker import BackgroundJob, JobCancelled, Preview, transform, transform_file
+from src.rekey import Rekeyer
+from src.schedule import ScheduleCache, schedule_cache
 
 
 def test_matrix_generation():
@@ -174,6 +190,720 @@ def test_edge_cases():
     print("  ✓ Passed")
 
 
+def test_digraph_tables():
+    """Test precomputed digraph tables over alphabet codes."""
+    print("Testing digraph tables...")
+    
+    cipher = PlayFairCipher("MONARCHY")
+    codec = cipher._codec
+    
+    assert codec.decode(codec.encode(cipher.ALPHABET)) == cipher.ALPHABET
+    assert sorted(cipher._cells) == list(range(25))
+    
+    for a in range(25):
+        for b in range(25):
+            encrypted = codec.split(cipher._encrypt_table[codec.offset(a, b)])
+            assert encrypted == cipher._code_rule(a, b, 1)
+            assert cipher._decrypt_table[codec.offset(*encrypted)] == codec.join(a, b)
+    
+    assert cipher._apply_rule('A', 'B', mode='decrypt') == \
+        codec.decode(cipher._code_rule(codec.index['A'], codec.index['B'], -1))
+    
+    print("  ✓ Passed")
+
+
+def test_verbose_decrypt():
+    """Test that verbose decryption lists a trailing unpaired character."""
+    print("Testing verbose decryption...")
+    
+    output = io.StringIO()
+    with redirect_stdout(output):
+        result = PlayFairCipher("MONARCHY").decrypt("ab cx q", verbose=True)
+    
+    assert "Digraphs: AB CX Q\n" in output.getvalue()
+    assert "  CX → " in output.getvalue() and "  Q → " not in output.getvalue()
+    assert result == PlayFairCipher("MONARCHY").decrypt("ABCX")
+    
+    print("  ✓ Passed")
+
+
+def test_vectorized_backend():
+    """Test that the NumPy backend matches the pure-Python path."""
+    print("Testing vectorized backend...")
+    
+    if vectorized.np is None:
+        print("  - Skipped (NumPy not installed)")
+        return
+    
+    cipher = PlayFairCipher("MONARCHY")
+    text = "Meet me at the old bridge, just at noon! " * 200
+    
+    digraphs = cipher._prepare_text(text)
+    ciphertext = cipher.encrypt(text)
+    assert ciphertext == ''.join(cipher._apply_rule(d[0], d[1]) for d in digraphs)
+    assert cipher.decrypt(ciphertext.lower() + " q") == ''.join(digraphs)
+    
+    print("  ✓ Passed")
+
+
+def test_encryptor_streaming():
+    """Test that chunked encryption matches one-shot encryption."""
+    print("Testing streaming encryptor...")
+    
+    cipher = PlayFairCipher("MONARCHY")
+    
+    assert cipher._prepare_text("AAABBXX") == ['AX', 'AX', 'AB', 'BX', 'XX']
+    
+    rng = random.Random(7)
+    text = "Balloon jazz, see the bookkeeper! " * 50
+    expected = cipher.encrypt(text)
+    
+    for _ in range(20):
+        encryptor = cipher.encryptor()
+        parts = []
+        i = 0
+        while i < len(text):
+            step = rng.randint(0, 9)
+            parts.append(encryptor.update(text[i:i + step]))
+            i += step
+        parts.append(encryptor.finalize())
+        assert ''.join(parts) == expected
+    
+    print("  ✓ Passed")
+
+
+def test_decryptor_streaming():
+    """Test that chunked decryption matches one-shot decryption."""
+    print("Testing streaming decryptor...")
+    
+    cipher = PlayFairCipher("MONARCHY")
+    
+    rng = random.Random(11)
+    ciphertext = cipher.encrypt("Attack at dawn, hold the bridge 42 " * 40) + "Q"
+    expected = cipher.decrypt(ciphertext)
+    
+    for _ in range(20):
+        decryptor = cipher.decryptor()
+        parts = []
+        i = 0
+        while i < len(ciphertext):
+            step = rng.randint(0, 9)
+            parts.append(decryptor.update(ciphertext[i:i + step]))
+            i += step
+        parts.append(decryptor.finalize())
+        assert ''.join(parts) == expected
+    
+    lines = [ciphertext[i:i + 61] + "\n" for i in range(0, len(ciphertext), 61)]
+    assert ''.join(cipher.iter_decrypt(lines)) == expected
+    
+    print("  ✓ Passed")
+
+
+def test_decrypt_file():
+    """Test memory-mapped file decryption on both backends."""
+    print("Testing file decryption...")
+    
+    cipher = PlayFairCipher("MONARCHY")
+    ciphertext = cipher.encrypt("Wire the funds to account 7781 by noon " * 30)
+    lines = [ciphertext[i:i + 64] for i in range(0, len(ciphertext), 64)]
+    expected = cipher.decrypt(ciphertext)
+    
+    numpy_module = vectorized.np
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "cipher.txt")
+        dst = os.path.join(tmp, "plain.txt")
+        with open(src, "w") as f:
+            f.write("\n".join(lines).lower() + "\nQ")
+        
+        try:
+            for backend in (numpy_module, None):
+                vectorized.np = backend
+                written = cipher.decrypt_file(src, dst)
+                with open(dst) as f:
+                    assert f.read() == expected
+                assert written == len(expected)
+        finally:
+            vectorized.np = numpy_module
+        
+        open(src, "w").close()
+        assert cipher.decrypt_file(src, dst) == 0
+    
+    print("  ✓ Passed")
+
+
+def test_parallel_decrypt():
+    """Test multiprocess decryption against single-process decryption."""
+    print("Testing parallel decryption...")
+    
+    cipher = PlayFairCipher("MONARCHY")
+    ciphertext = cipher.encrypt("Convoy leaves pier 9 at dusk, hold fire " * 50)
+    
+    min_length, chunk_size = parallel.MIN_PARALLEL_LENGTH, parallel.CHUNK_SIZE
+    parallel.MIN_PARALLEL_LENGTH, parallel.CHUNK_SIZE = 0, 64
+    try:
+        assert cipher.decrypt_bulk(ciphertext + "Q", workers=2) == cipher.decrypt(ciphertext)
+        assert cipher.decrypt_bulk("", workers=2) == ""
+    finally:
+        parallel.MIN_PARALLEL_LENGTH, parallel.CHUNK_SIZE = min_length, chunk_size
+    
+    assert cipher.decrypt_bulk(ciphertext, workers=1) == cipher.decrypt(ciphertext)
+    
+    print("  ✓ Passed")
+
+
+def test_parallel_encrypt():
+    """Test multiprocess encryption against single-process encryption."""
+    print("Testing parallel encryption...")
+    
+    cipher = PlayFairCipher("MONARCHY")
+    rng = random.Random(5)
+    text = "Balloon kettle, see the bookkeeper " * 20 + ''.join(rng.choice("AAX") for _ in range(500))
+    
+    min_length, chunk_size = parallel.MIN_PARALLEL_LENGTH, parallel.CHUNK_SIZE
+    parallel.MIN_PARALLEL_LENGTH = 0
+    try:
+        for size in (2, 7, 64):
+            parallel.CHUNK_SIZE = size
+            assert cipher.encrypt_bulk(text, workers=2) == cipher.encrypt(text)
+    finally:
+        parallel.MIN_PARALLEL_LENGTH, parallel.CHUNK_SIZE = min_length, chunk_size
+    
+    print("  ✓ Passed")
+
+
+def test_schedule_cache():
+    """Test the shared LRU cache of key schedules."""
+    print("Testing schedule cache...")
+    
+    schedule_cache.clear()
+    first = PlayFairCipher("monarchy")
+    second = PlayFairCipher("MONARCHY")
+    assert first._schedule is second._schedule
+    assert schedule_cache.info().hits == 1
+    assert schedule_cache.info().misses == 1
+    
+    matrix = first.get_matrix()
+    matrix[0][0] = '?'
+    assert second.get_matrix()[0][0] == 'M'
+    
+    cache = ScheduleCache(maxsize=2)
+    cache.get('a', lambda: 1)
+    cache.get('b', lambda: 2)
+    cache.get('a', lambda: 3)
+    cache.get('c', lambda: 4)
+    assert cache.get('a', lambda: 5) == 1
+    assert cache.get('b', lambda: 6) == 6
+    assert cache.info() == (2, 4, 2, 2)
+    
+    cache.maxsize = 0
+    assert len(cache) == 0
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 0)
+    
+    print("  ✓ Passed")
+
+
+def test_text_normalization():
+    """Test single-pass cleaning of dirty, non-ASCII and clean text."""
+    print("Testing text normalization...")
+    
+    cipher = PlayFairCipher("KEY")
+    assert cipher._clean("Hello, World! 123") == "HELLOWORLD"
+    assert cipher._clean("jump") == "IUMP"
+    assert cipher._clean("café ıß") == "CAFISS"
+    assert cipher._clean("") == ""
+    
+    clean = "ALREADYCLEAN"
+    assert cipher._clean(clean) is clean
+    assert cipher._byte_tables().clean(b"jump, 42") == b"IUMP"
+    
+    print("  ✓ Passed")
+
+
+def test_compact_instances():
+    """Test slotted ciphers with a flat matrix and lazily built tables."""
+    print("Testing compact cipher instances...")
+    
+    schedule_cache.clear()
+    cipher = PlayFairCipher("TENANTKEY")
+    assert not hasattr(cipher, '__dict__')
+    assert len(cipher._cells) == len(cipher._positions) == 25
+    assert cipher._schedule.tables is None
+    
+    matrix = cipher.get_matrix()
+    assert matrix == [list(row) for row in cipher.matrix]
+    for char, (row, col) in cipher.position_map.items():
+        assert matrix[row][col] == char
+    
+    cipher.encrypt("HELLO")
+    assert cipher._schedule.tables is not None
+    assert len(cipher._encrypt_table) == len(cipher._decrypt_table) == 25 * 25
+    assert cipher._encrypt_table.itemsize == 2
+    
+    print("  ✓ Passed")
+
+
+def test_batch_api():
+    """Test encrypt_many / decrypt_many against per-message calls."""
+    print("Testing batch API...")
+    
+    messages = ["Hello World", "balloon", "", "x", "Attack at dawn!"]
+    items = [(key, message) for message in messages for key in ("alpha", "BRAVO", "Alpha")]
+    
+    ciphertexts = PlayFairCipher.encrypt_many(items)
+    assert ciphertexts == [PlayFairCipher(key).encrypt(message) for key, message in items]
+    
+    pairs = list(zip((key for key, _ in items), ciphertexts))
+    plaintexts = PlayFairCipher.decrypt_many(pairs)
+    assert plaintexts == [PlayFairCipher(key).decrypt(text) for key, text in pairs]
+    assert PlayFairCipher.decrypt_many(pairs, workers=2) == plaintexts
+    
+    assert PlayFairCipher.encrypt_many(messages, key="alpha") == ciphertexts[0::3]
+    assert PlayFairCipher.encrypt_many([]) == []
+    
+    print("  ✓ Passed")
+
+
+def test_key_fanout():
+    """Test encrypting one message under many keys on both backends."""
+    print("Testing multi-key fan-out...")
+    
+    rng = random.Random(15)
+    keys = ["K" + ''.join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789") for _ in range(8))
+            for _ in range(300)]
+    text = "Balloon kettle, see the bookkeeper"
+    expected = [PlayFairCipher(key).encrypt(text) for key in keys]
+    
+    numpy_module = vectorized.np
+    try:
+        for backend in (numpy_module, None):
+            vectorized.np = backend
+            assert list(PlayFairCipher.encrypt_fanout(text, keys)) == expected
+            assert list(PlayFairCipher.encrypt_fanout("", keys[:3])) == ["", "", ""]
+            assert list(PlayFairCipher.encrypt_fanout(text, [])) == []
+    finally:
+        vectorized.np = numpy_module
+    
+    print("  ✓ Passed")
+
+
+def test_composed_cipher():
+    """Test fused multi-round encryption against chained rounds."""
+    print("Testing composed cipher...")
+    
+    rng = random.Random(16)
+    keys = ["MONARCHY", "PLAYFAIR", "KEY7"]
+    composed = PlayFairCipher.compose(keys)
+    rounds = [PlayFairCipher(key) for key in keys]
+    
+    texts = ["Hello World", "xx", "BOX X", ""]
+    texts += [''.join(rng.choice("ABXXCDJY x") for _ in range(rng.randint(0, 40))) for _ in range(300)]
+    for text in texts:
+        expected = text
+        for cipher in rounds:
+            expected = cipher.encrypt(expected)
+        assert composed.encrypt(text) == expected
+        
+        plaintext = expected
+        for cipher in reversed(rounds):
+            plaintext = cipher.decrypt(plaintext)
+        assert composed.decrypt(expected) == plaintext
+    
+    try:
+        ComposedCipher([])
+        assert False, "Should raise ValueError"
+    except ValueError:
+        pass
+    
+    print("  ✓ Passed")
+
+
+def test_rekey():
+    """Test direct re-keying of ciphertext and files."""
+    print("Testing re-keying...")
+    
+    old, new = PlayFairCipher("OLDKEY"), PlayFairCipher("NEWKEY")
+    text = "Balloon kettle, box XX and the bookkeeper x"
+    ciphertext = old.encrypt(text * 50)
+    
+    rekeyed = PlayFairCipher.rekey(ciphertext, "OLDKEY", "NEWKEY")
+    assert len(rekeyed) == len(ciphertext)
+    assert new.decrypt(rekeyed) == old.decrypt(ciphertext)
+    assert PlayFairCipher.rekey(ciphertext.lower() + " Q", "OLDKEY", "NEWKEY") == rekeyed
+    
+    with tempfile.TemporaryDirectory() as directory:
+        src = os.path.join(directory, "old.txt")
+        dst = os.path.join(directory, "new.txt")
+        with open(src, 'w') as f:
+            f.write(ciphertext[:101] + "\n" + ciphertext[101:])
+        
+        assert Rekeyer(old, new).rekey_file(src, dst, block_size=64) == len(rekeyed)
+        with open(dst) as f:
+            assert f.read() == rekeyed
+    
+    print("  ✓ Passed")
+
+
+def test_directory_rotation():
+    """Test resumable key rotation over a directory tree."""
+    print("Testing directory key rotation...")
+    
+    old = PlayFairCipher("OLDKEY")
+    texts = {"a.txt": "Hello World", os.path.join("sub", "b.txt"): "Balloon kettle " * 40,
+             os.path.join("sub", "c.txt"): ""}
+    
+    with tempfile.TemporaryDirectory() as root:
+        os.mkdir(os.path.join(root, "sub"))
+        for name, text in texts.items():
+            with open(os.path.join(root, name), 'w') as f:
+                f.write(old.encrypt(text))
+        
+        # A killed run: a.txt journaled with its rename still pending
+        journal = os.path.join(root, rotate.JOURNAL_NAME)
+        fingerprint = rotate._fingerprint(PlayFairCipher, "OLDKEY", "NEWKEY")
+        with open(journal, 'w') as f:
+            f.write(f"# rotation {fingerprint}\na.txt\n")
+        with open(os.path.join(root, "a.txt" + rotate.TEMP_SUFFIX), 'w') as f:
+            f.write(PlayFairCipher.rekey(old.encrypt(texts["a.txt"]), "OLDKEY", "NEWKEY"))
+        
+        summary = rotate.rotate_directory(PlayFairCipher, root, "OLDKEY", "NEWKEY", workers=2)
+        assert summary.skipped == 1
+        assert sorted(os.path.relpath(r.path, root) for r in summary.results) == sorted(texts)[1:]
+        
+        new = PlayFairCipher("NEWKEY")
+        for name, text in texts.items():
+            with open(os.path.join(root, name)) as f:
+                assert new.decrypt(f.read()) == old.decrypt(old.encrypt(text))
+        assert rotate.find_files(root, exclude=journal) == sorted(texts)
+        
+        # Re-running the finished rotation changes nothing
+        assert rotate.rotate_directory(PlayFairCipher, root, "OLDKEY", "NEWKEY").results == []
+        try:
+            rotate.rotate_directory(PlayFairCipher, root, "NEWKEY", "OTHER")
+            assert False, "Should raise ValueError"
+        except ValueError:
+            pass
+        try:
+            rotate.rotate_directory(PlayFairCipher, os.path.join(root, "missing"), "OLDKEY", "NEWKEY")
+            assert False, "Should raise ValueError"
+        except ValueError:
+            pass
+        
+        args = argparse.Namespace(directory=root, old_key="OLDKEY", new_key="NEWKEY", workers=1,
+                                  pattern='*', journal=os.path.join(root, "missing", "journal"),
+                                  verbose=False)
+        assert rotate.run_rotation(PlayFairCipher, args) == 2
+    
+    print("  ✓ Passed")
+
+
+def test_pipe_commands():
+    """Test the streaming encrypt/decrypt subcommands on files."""
+    print("Testing pipeline commands...")
+    
+    text = "Zoë met the bookkeeper at noon. " * 300
+    
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [os.path.join(directory, name) for name in ("in.txt", "enc.txt", "dec.txt")]
+        with open(paths[0], 'w', encoding='utf-8') as f:
+            f.write(text)
+        
+        args = argparse.Namespace(key="MONARCHY", input=paths[0], output=paths[1], chunk_size=7)
+        assert pipe.run(PlayFairCipher, args, 'encrypt') == 0
+        args = argparse.Namespace(key="MONARCHY", input=paths[1], output=paths[2],
+                                  chunk_size=1000, workers=2)
+        assert pipe.run(PlayFairCipher, args, 'decrypt') == 0
+        
+        cipher = PlayFairCipher("MONARCHY")
+        with open(paths[1]) as f:
+            ciphertext = f.read()
+        with open(paths[2]) as f:
+            assert f.read() == cipher.decrypt(ciphertext)
+        assert ciphertext == cipher.encrypt(text)
+        
+        args = argparse.Namespace(key="123", input=paths[0], output=paths[2], chunk_size=7)
+        assert pipe.run(PlayFairCipher, args, 'encrypt') == 2
+    
+    parser = argparse.ArgumentParser()
+    pipe.add_arguments(parser)
+    assert parser.parse_args(['--key', 'K', '--chunk-size', '7']).chunk_size == 7
+    parser = argparse.ArgumentParser()
+    pipe.add_arguments(parser, workers=True)
+    assert parser.parse_args(['--key', 'K', '--workers', '2']).workers == 2
+    parser = argparse.ArgumentParser()
+    rotate.add_arguments(parser)
+    args = parser.parse_args(['DIR', '--old-key', 'A', '--new-key', 'B', '--workers', '2'])
+    assert args.workers == 2
+    for value in ('0', '-1', 'x'):
+        try:
+            pipe.positive_int(value)
+            assert False, "Should raise ArgumentTypeError"
+        except argparse.ArgumentTypeError:
+            pass
+    
+    print("  ✓ Passed")
+
+
+def test_jsonl_batch():
+    """Test JSONL batch processing, including malformed records."""
+    print("Testing JSONL batch...")
+    
+    cipher = PlayFairCipher("MONARCHY")
+    lines = [
+        json.dumps({"id": 1, "key": "MONARCHY", "op": "encrypt", "text": "Hello World"}),
+        '{"id": 2, "key": "MONARCHY"',
+        "",
+        json.dumps({"id": 3, "key": "PLAYFAIR", "op": "encrypt", "text": "Hide the gold"}),
+        json.dumps({"id": 4, "key": "MONARCHY", "op": "decrypt",
+                    "text": cipher.encrypt("Attack at dawn")}),
+        json.dumps({"id": 5, "key": "123", "op": "encrypt", "text": "Hello"}),
+        json.dumps({"id": 6, "key": "MONARCHY", "op": "shred", "text": "Hello"}),
+        json.dumps([1, 2]),
+    ]
+    lines = [line.encode('utf-8') for line in lines] + [b'{"id": 9, "text": "\xff"}', b'[' * 100000]
+    expected = {
+        1: cipher.encrypt("Hello World"),
+        3: PlayFairCipher("PLAYFAIR").encrypt("Hide the gold"),
+        4: cipher.decrypt(cipher.encrypt("Attack at dawn")),
+    }
+    
+    for workers, ordered, window in ((1, True, 3), (2, True, 2), (2, False, 4096)):
+        output = []
+        stats = jsonl.process_jsonl(PlayFairCipher, lines, output.append,
+                                    workers=workers, ordered=ordered, window=window)
+        records = [json.loads(line) for block in output for line in block.splitlines()]
+        assert stats.records == 9 and stats.failed == 6
+        if ordered:
+            assert [record["id"] for record in records] == [1, None, 3, 4, 5, 6, None, None, None]
+        assert {record["id"]: record["text"] for record in records if "text" in record} == expected
+        errors = {record["line"] for record in records if "error" in record}
+        assert errors == {2, 6, 7, 8, 9, 10}
+        assert any(record["error"].startswith("invalid UTF-8") for record in records if "error" in record)
+    
+    try:
+        jsonl.process_jsonl(PlayFairCipher, lines, output.append, workers=1, window=0)
+        assert False, "Should raise ValueError"
+    except ValueError:
+        pass
+    
+    parser = argparse.ArgumentParser()
+    jsonl.add_arguments(parser)
+    assert parser.parse_args(['--workers', '3']).workers == 3
+    
+    print("  ✓ Passed")
+
+
+def test_background_job():
+    """Test chunked cipher work on a background thread."""
+    print("Testing background jobs...")
+    
+    class Root:
+        """Runs after() callbacks in order, like a Tk event loop."""
+        def __init__(self):
+            self.pending = []
+        
+        def after(self, ms, callback):
+            self.pending.append(callback)
+        
+        def mainloop(self):
+            while self.pending:
+                time.sleep(0.001)
+                self.pending.pop(0)()
+    
+    cipher = PlayFairCipher("MONARCHY")
+    text = "Operators check multi megabyte exports. " * 500
+    events = []
+    
+    root = Root()
+    job = BackgroundJob(root, lambda job: transform(job, cipher, text, 'encrypt', chunk_size=1001),
+                        on_done=lambda transcript: events.append(transcript),
+                        on_progress=lambda job: events.append(job.done))
+    job.start()
+    root.mainloop()
+    transcript = events[-1]
+    assert transcript.output == cipher.encrypt(text)
+    assert transcript.source == cipher._prepare(text)
+    assert job.done == job.total == len(transcript.source) and not job.running
+    
+    events = []
+    job = BackgroundJob(root, lambda job: transform(job, cipher, transcript.output + "Q", 'decrypt'),
+                        on_done=events.append)
+    job.start()
+    root.mainloop()
+    assert events == [(transcript.output, cipher.decrypt(transcript.output))]
+    
+    events = []
+    job = BackgroundJob(root, lambda job: transform(job, cipher, text * 20, 'encrypt', chunk_size=2),
+                        on_done=events.append, on_cancel=lambda: events.append("cancelled"))
+    job.start()
+    job.cancel()
+    root.mainloop()
+    assert events == ["cancelled"]
+    
+    job = BackgroundJob(root, lambda job: PlayFairCipher("123"), on_done=events.append,
+                        on_error=events.append)
+    job.start()
+    root.mainloop()
+    assert isinstance(events[-1], ValueError)
+    
+    print("  ✓ Passed")
+
+
+def test_trace_log():
+    """Test the process log model and its export."""
+    print("Testing process log...")
+    
+    cipher = PlayFairCipher("MONARCHY")
+    source = cipher._prepare("Balloon festival at noon " * 40)
+    output = cipher._apply_tables(source, mode='encrypt')
+    
+    log = TraceLog()
+    log.append("ENCRYPTION")
+    log.append("Input: ...\n")
+    log.add_steps(source, output)
+    log.append(f"\nOutput: {output}")
+    
+    expected = ["ENCRYPTION", "Input: ...", ""]
+    expected += [f"{source[i:i+2]} → {output[i:i+2]}" for i in range(0, len(source), 2)]
+    expected += ["", f"Output: {output}"]
+    assert len(log) == len(expected)
+    assert log.lines(0, len(log)) == expected
+    assert log.lines(2, 6) == expected[2:6]
+    assert log.lines(len(log) - 3, len(log) + 10) == expected[-3:]
+    assert log.step_at(3) == (source[:2], output[:2])
+    assert log.step_at(4) == (source[2:4], output[2:4])
+    assert log.step_at(0) is None and log.step_at(len(log)) is None
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "trace.txt")
+        assert log.export(path) == len(expected)
+        with open(path, encoding='utf-8') as f:
+            assert f.read() == '\n'.join(expected) + '\n'
+    
+    log.clear()
+    assert len(log) == 0 and log.lines(0, 10) == []
+    
+    print("  ✓ Passed")
+
+
+def test_incremental_preparation():
+    """Test live re-encryption of only the digraphs an edit affects."""
+    print("Testing incremental preparation...")
+    
+    cipher = PlayFairCipher("MONARCHY")
+    rng = random.Random(7)
+    text = ''.join(rng.choice("abjxX .") for _ in range(400))
+    live = LiveEncryption(cipher, text)
+    assert live.ciphertext == cipher.encrypt(text)
+    
+    for _ in range(300):
+        start = rng.randint(0, len(text))
+        stop = min(len(text), start + rng.randint(0, 5))
+        text = text[:start] + ''.join(rng.choice("abjxX .") for _ in range(rng.randint(0, 5))) + text[stop:]
+        previous = live.ciphertext
+        begin, end, replacement = live.update(text)
+        assert previous[:begin] + replacement + previous[end:] == live.ciphertext
+        assert live.ciphertext == cipher.encrypt(text)
+        assert live.preparation.digraphs() == cipher._prepare_text(text)
+    
+    # Typing in the middle of a long text only touches nearby digraphs
+    preparation = IncrementalPreparation(cipher, text * 50)
+    begin, end, segment = preparation.update(text * 25 + "a" + text * 25)
+    assert end - begin < 100 and preparation.prepared == cipher._prepare(text * 25 + "a" + text * 25)
+    assert preparation.digraph_at(len(preparation.clean) - 1) == len(preparation.prepared) // 2 - 1
+    
+    print("  ✓ Passed")
+
+
+def test_file_job():
+    """Test streaming a file through the cipher with previews."""
+    print("Testing file jobs...")
+    
+    class Job:
+        """Records progress; cancels after a given number of reports."""
+        def __init__(self, limit=None):
+            self.reports = []
+            self.limit = limit
+        
+        def report(self, done, total):
+            self.reports.append((done, total))
+            if self.limit is not None and len(self.reports) > self.limit:
+                raise JobCancelled()
+    
+    cipher = PlayFairCipher("MONARCHY")
+    text = "Zoë keeps the balloon in the cellar. " * 400
+    
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [os.path.join(directory, name) for name in ("in.txt", "enc.txt", "dec.txt")]
+        with open(paths[0], 'w', encoding='utf-8') as f:
+            f.write(text)
+        
+        job = Job()
+        result = transform_file(job, cipher, paths[0], paths[1], 'encrypt', chunk_size=999)
+        with open(paths[1]) as f:
+            ciphertext = f.read()
+        assert ciphertext == cipher.encrypt(text)
+        assert result.source_bytes == len(text.encode('utf-8')) == job.reports[-1][0]
+        assert result.output_bytes == len(ciphertext)
+        assert result.source.chars == len(text) and result.output.chars == len(ciphertext)
+        assert result.output.render().startswith(ciphertext[:100])
+        assert result.output.render().endswith(ciphertext[-100:])
+        assert "characters not shown" in result.output.render()
+        
+        result = transform_file(Job(), cipher, paths[1], paths[2], 'decrypt')
+        with open(paths[2]) as f:
+            assert f.read() == cipher.decrypt(ciphertext)
+        
+        try:
+            transform_file(Job(limit=3), cipher, paths[0], paths[2], 'encrypt', chunk_size=100)
+            assert False, "Should have been cancelled"
+        except JobCancelled:
+            assert not os.path.exists(paths[2])
+        
+        try:
+            transform_file(Job(), cipher, paths[0], paths[0], 'encrypt')
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+    
+    preview = Preview(size=5)
+    preview.add("HELLO")
+    preview.add("WORLD")
+    assert preview.render() == "HELLOWORLD"
+    preview.add("!")
+    assert preview.head == "HELLO" and preview.tail == "ORLD!" and "1 characters" in preview.render()
+    
+    print("  ✓ Passed")
+
+
+def test_generic_grid():
+    """Test the generic engine with a larger 7x7 grid."""
+    print("Testing generic 7x7 grid...")
+    
+    class PlayFairCipher7x7(PlayFairEngine):
+        ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 .,?!'-:;()/&"
+        SIZE = 7
+    
+    cipher = PlayFairCipher7x7("Q&A, 2026!")
+    assert len(cipher.get_matrix()) == 7
+    assert cipher.get_matrix()[0][:4] == ['Q', '&', 'A', ',']
+    assert sorted(cipher._cells) == list(range(49))
+    
+    message = "Meet at 10:30 (pier 4), bring the map & keys."
+    ciphertext = cipher.encrypt(message)
+    assert cipher.decrypt(ciphertext) == ''.join(cipher._prepare_text(message))
+    
+    try:
+        class BrokenCipher(PlayFairEngine):
+            ALPHABET = "ABCD"
+            SIZE = 3
+        assert False, "Should have raised TypeError"
+    except TypeError:
+        pass
+    
+    print("  ✓ Passed")
+
+
 def run_tests():
     """Run all tests."""
     print("\n" + "="*60)
@@ -190,6 +920,29 @@ def run_tests():
         test_same_column_rule,
         test_rectangle_rule,
         test_edge_cases,
+        test_digraph_tables,
+        test_verbose_decrypt,
+        test_vectorized_backend,
+        test_encryptor_streaming,
+        test_decryptor_streaming,
+        test_decrypt_file,
+        test_parallel_decrypt,
+        test_parallel_encrypt,
+        test_schedule_cache,
+        test_generic_grid,
+        test_text_normalization,
+        test_compact_instances,
+        test_batch_api,
+        test_key_fanout,
+        test_composed_cipher,
+        test_rekey,
+        test_incremental_preparation,
+        test_directory_rotation,
+        test_pipe_commands,
+        test_jsonl_batch,
+        test_background_job,
+        test_file_job,
+        test_trace_log,
     ]
     
     passed = 0
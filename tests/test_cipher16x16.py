@@ -0,0 +1,145 @@
+"""
+PlayFair Cipher 16x16 Test Suite
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.cipher16x16 import PlayFairCipher16x16
+from src import vectorized
+
+
+def test_matrix_generation():
+    """Test cipher matrix generation."""
+    print("Testing 16x16 matrix generation...")
+    
+    cipher = PlayFairCipher16x16(b"KEY")
+    matrix = cipher.get_matrix()
+    
+    assert len(matrix) == 16
+    assert all(len(row) == 16 for row in matrix)
+    assert sorted(byte for row in matrix for byte in row) == list(range(256))
+    assert matrix[0][:4] == [ord('K'), ord('E'), ord('Y'), 0]
+    
+    print("  ✓ Passed")
+
+
+def test_digraph_tables():
+    """Test that every digraph decrypts back to itself."""
+    print("Testing digraph tables...")
+    
+    cipher = PlayFairCipher16x16("schlüssel")
+    
+    assert len(cipher._encrypt_table) == 65536
+    for a in range(0, 256, 7):
+        for b in range(256):
+            encrypted = cipher._apply_rule(a, b, mode='encrypt')
+            assert cipher._apply_rule(*encrypted, mode='decrypt') == (a, b)
+    
+    print("  ✓ Passed")
+
+
+def test_round_trip():
+    """Test binary round trips on both backends."""
+    print("Testing binary round trip...")
+    
+    cipher = PlayFairCipher16x16(b"\x00\xffsecret")
+    payloads = [
+        b"",
+        b"\x80",
+        b"\x00\x00",
+        b"\x80\x00",
+        bytes(range(256)) * 3 + b"\x01",
+        '{"name": "Zoë", "id": 7}'.encode('utf-8'),
+    ]
+    
+    numpy_module = vectorized.np
+    try:
+        for backend in (numpy_module, None):
+            vectorized.np = backend
+            for payload in payloads:
+                ciphertext = cipher.encrypt(payload)
+                assert len(ciphertext) == len(payload) + 2 - len(payload) % 2
+                assert cipher.decrypt(ciphertext) == payload
+                assert cipher.decrypt(bytearray(ciphertext)) == payload
+    finally:
+        vectorized.np = numpy_module
+    
+    print("  ✓ Passed")
+
+
+def test_blocks():
+    """Test unpadded block encryption for streams."""
+    print("Testing block encryption...")
+    
+    cipher = PlayFairCipher16x16(b"stream")
+    data = bytes(range(200)) * 10
+    
+    ciphertext = b''.join(cipher.encrypt_block(data[i:i + 100]) for i in range(0, 1900, 100))
+    ciphertext += cipher.encrypt(data[1900:])
+    assert ciphertext == cipher.encrypt(data)
+    assert cipher.decrypt(ciphertext) == data
+    
+    print("  ✓ Passed")
+
+
+def test_invalid_input():
+    """Test error handling."""
+    print("Testing invalid input handling...")
+    
+    try:
+        PlayFairCipher16x16(b"")
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    
+    cipher = PlayFairCipher16x16(b"KEY")
+    for ciphertext in (b"\x01\x02\x03", cipher.encrypt_block(b"\x01\x02")):
+        try:
+            cipher.decrypt(ciphertext)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+    
+    print("  ✓ Passed")
+
+
+def run_all_tests():
+    """Run all test functions."""
+    print("\n" + "="*60)
+    print("  PLAYFAIR CIPHER 16x16 TEST SUITE")
+    print("="*60 + "\n")
+    
+    test_functions = [
+        test_matrix_generation,
+        test_digraph_tables,
+        test_round_trip,
+        test_blocks,
+        test_invalid_input,
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test_func in test_functions:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"  ✗ Failed: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  ✗ Error: {e}")
+            failed += 1
+    
+    print("\n" + "="*60)
+    print(f"  Results: {passed} passed, {failed} failed")
+    print("="*60 + "\n")
+    
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -4,9 +4,16 @@ PlayFair Cipher 6x6 Test Suite
 
 import sys
 import os
+import random
+import tempfile
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from src.cipher6x6 import PlayFairCipher6x6
+from src import parallel, vectorized
+from src.compose import ComposedCipher
+from src.incremental import IncrementalPreparation, LiveEncryption
+from src.rekey import Rekeyer
+from src.schedule import schedule_cache
 
 
 def test_matrix_generation():
@@ -281,6 +288,357 @@ def test_verbose_output():
     print("  ✓ Passed")
 
 
+def test_digraph_tables():
+    """Test precomputed digraph tables over alphabet codes."""
+    print("Testing digraph tables...")
+    
+    cipher = PlayFairCipher6x6("CRYPTO")
+    codec = cipher._codec
+    
+    assert codec.decode(codec.encode(cipher.ALPHABET)) == cipher.ALPHABET
+    assert sorted(cipher._cells) == list(range(36))
+    
+    for a in range(36):
+        for b in range(36):
+            encrypted = codec.split(cipher._encrypt_table[codec.offset(a, b)])
+            assert encrypted == cipher._code_rule(a, b, 1)
+            assert cipher._decrypt_table[codec.offset(*encrypted)] == codec.join(a, b)
+    
+    assert cipher._apply_rule('A', 'B', mode='decrypt') == \
+        codec.decode(cipher._code_rule(codec.index['A'], codec.index['B'], -1))
+    
+    print("  ✓ Passed")
+
+
+def test_vectorized_backend():
+    """Test that the NumPy backend matches the pure-Python path."""
+    print("Testing vectorized backend...")
+    
+    if vectorized.np is None:
+        print("  - Skipped (NumPy not installed)")
+        return
+    
+    cipher = PlayFairCipher6x6("CRYPTO2026")
+    text = "Agent 007 meets at room 404, port 8080. " * 200
+    
+    digraphs = cipher._prepare_text(text)
+    ciphertext = cipher.encrypt(text)
+    assert ciphertext == ''.join(cipher._apply_rule(d[0], d[1]) for d in digraphs)
+    assert cipher.decrypt(ciphertext.lower() + " q") == ''.join(digraphs)
+    
+    print("  ✓ Passed")
+
+
+def test_encryptor_streaming():
+    """Test that chunked encryption matches one-shot encryption."""
+    print("Testing streaming encryptor...")
+    
+    cipher = PlayFairCipher6x6("CRYPTO2026")
+    
+    assert cipher._prepare_text("AAABBXX") == ['AX', 'AX', 'AB', 'BX', 'XX']
+    
+    rng = random.Random(7)
+    text = "Room 1001, see the bookkeeper at 4400! " * 50
+    expected = cipher.encrypt(text)
+    
+    for _ in range(20):
+        encryptor = cipher.encryptor()
+        parts = []
+        i = 0
+        while i < len(text):
+            step = rng.randint(0, 9)
+            parts.append(encryptor.update(text[i:i + step]))
+            i += step
+        parts.append(encryptor.finalize())
+        assert ''.join(parts) == expected
+    
+    print("  ✓ Passed")
+
+
+def test_decryptor_streaming():
+    """Test that chunked decryption matches one-shot decryption."""
+    print("Testing streaming decryptor...")
+    
+    cipher = PlayFairCipher6x6("CRYPTO2026")
+    
+    rng = random.Random(11)
+    ciphertext = cipher.encrypt("Attack at dawn, hold the bridge 42 " * 40) + "Q"
+    expected = cipher.decrypt(ciphertext)
+    
+    for _ in range(20):
+        decryptor = cipher.decryptor()
+        parts = []
+        i = 0
+        while i < len(ciphertext):
+            step = rng.randint(0, 9)
+            parts.append(decryptor.update(ciphertext[i:i + step]))
+            i += step
+        parts.append(decryptor.finalize())
+        assert ''.join(parts) == expected
+    
+    lines = [ciphertext[i:i + 61] + "\n" for i in range(0, len(ciphertext), 61)]
+    assert ''.join(cipher.iter_decrypt(lines)) == expected
+    
+    print("  ✓ Passed")
+
+
+def test_decrypt_file():
+    """Test memory-mapped file decryption on both backends."""
+    print("Testing file decryption...")
+    
+    cipher = PlayFairCipher6x6("CRYPTO2026")
+    ciphertext = cipher.encrypt("Wire the funds to account 7781 by noon " * 30)
+    lines = [ciphertext[i:i + 64] for i in range(0, len(ciphertext), 64)]
+    expected = cipher.decrypt(ciphertext)
+    
+    numpy_module = vectorized.np
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "cipher.txt")
+        dst = os.path.join(tmp, "plain.txt")
+        with open(src, "w") as f:
+            f.write("\n".join(lines).lower() + "\nQ")
+        
+        try:
+            for backend in (numpy_module, None):
+                vectorized.np = backend
+                written = cipher.decrypt_file(src, dst)
+                with open(dst) as f:
+                    assert f.read() == expected
+                assert written == len(expected)
+        finally:
+            vectorized.np = numpy_module
+        
+        open(src, "w").close()
+        assert cipher.decrypt_file(src, dst) == 0
+    
+    print("  ✓ Passed")
+
+
+def test_parallel_decrypt():
+    """Test multiprocess decryption against single-process decryption."""
+    print("Testing parallel decryption...")
+    
+    cipher = PlayFairCipher6x6("CRYPTO2026")
+    ciphertext = cipher.encrypt("Convoy leaves pier 9 at dusk, hold fire " * 50)
+    
+    min_length, chunk_size = parallel.MIN_PARALLEL_LENGTH, parallel.CHUNK_SIZE
+    parallel.MIN_PARALLEL_LENGTH, parallel.CHUNK_SIZE = 0, 64
+    try:
+        assert cipher.decrypt_bulk(ciphertext + "Q", workers=2) == cipher.decrypt(ciphertext)
+        assert cipher.decrypt_bulk("", workers=2) == ""
+    finally:
+        parallel.MIN_PARALLEL_LENGTH, parallel.CHUNK_SIZE = min_length, chunk_size
+    
+    assert cipher.decrypt_bulk(ciphertext, workers=1) == cipher.decrypt(ciphertext)
+    
+    print("  ✓ Passed")
+
+
+def test_parallel_encrypt():
+    """Test multiprocess encryption against single-process encryption."""
+    print("Testing parallel encryption...")
+    
+    cipher = PlayFairCipher6x6("CRYPTO2026")
+    rng = random.Random(5)
+    text = "Room 1001, see the bookkeeper at 4400 " * 20 + ''.join(rng.choice("AAX") for _ in range(500))
+    
+    min_length, chunk_size = parallel.MIN_PARALLEL_LENGTH, parallel.CHUNK_SIZE
+    parallel.MIN_PARALLEL_LENGTH = 0
+    try:
+        for size in (2, 7, 64):
+            parallel.CHUNK_SIZE = size
+            assert cipher.encrypt_bulk(text, workers=2) == cipher.encrypt(text)
+    finally:
+        parallel.MIN_PARALLEL_LENGTH, parallel.CHUNK_SIZE = min_length, chunk_size
+    
+    print("  ✓ Passed")
+
+
+def test_schedule_cache():
+    """Test that ciphers with the same key share one schedule."""
+    print("Testing schedule cache...")
+    
+    first = PlayFairCipher6x6("crypto2026")
+    second = PlayFairCipher6x6("CRYPTO2026")
+    assert first._schedule is second._schedule
+    assert PlayFairCipher6x6("CRYPTO2027")._schedule is not first._schedule
+    
+    matrix = first.get_matrix()
+    matrix[0][0] = '?'
+    assert second.get_matrix()[0][0] == 'C'
+    
+    print("  ✓ Passed")
+
+
+def test_text_normalization():
+    """Test single-pass cleaning of dirty, non-ASCII and clean text."""
+    print("Testing text normalization...")
+    
+    cipher = PlayFairCipher6x6("KEY")
+    assert cipher._clean("Hello, World! 123") == "HELLOWORLD123"
+    assert cipher._clean("jump") == "JUMP"
+    assert cipher._clean("café ı²") == "CAFI"
+    
+    clean = "ALREADY2CLEAN"
+    assert cipher._clean(clean) is clean
+    assert cipher._byte_tables().clean(b"jump, 42") == b"JUMP42"
+    
+    print("  ✓ Passed")
+
+
+def test_compact_instances():
+    """Test slotted ciphers with a flat matrix and lazily built tables."""
+    print("Testing compact cipher instances...")
+    
+    schedule_cache.clear()
+    cipher = PlayFairCipher6x6("TENANT42")
+    assert not hasattr(cipher, '__dict__')
+    assert len(cipher._cells) == len(cipher._positions) == 36
+    assert cipher._schedule.tables is None
+    
+    matrix = cipher.get_matrix()
+    assert matrix == [list(row) for row in cipher.matrix]
+    for char, (row, col) in cipher.position_map.items():
+        assert matrix[row][col] == char
+    
+    cipher.encrypt("HELLO")
+    assert cipher._schedule.tables is not None
+    assert len(cipher._encrypt_table) == len(cipher._decrypt_table) == 36 * 36
+    assert cipher._encrypt_table.itemsize == 2
+    
+    print("  ✓ Passed")
+
+
+def test_batch_api():
+    """Test encrypt_many / decrypt_many against per-message calls."""
+    print("Testing batch API...")
+    
+    messages = ["Agent 007", "room 404", "", "7", "Meet at 10:30!"]
+    items = [(key, message) for message in messages for key in ("alpha", "BRAVO", "Alpha")]
+    
+    ciphertexts = PlayFairCipher6x6.encrypt_many(items)
+    assert ciphertexts == [PlayFairCipher6x6(key).encrypt(message) for key, message in items]
+    
+    pairs = list(zip((key for key, _ in items), ciphertexts))
+    plaintexts = PlayFairCipher6x6.decrypt_many(pairs)
+    assert plaintexts == [PlayFairCipher6x6(key).decrypt(text) for key, text in pairs]
+    assert PlayFairCipher6x6.decrypt_many(pairs, workers=2) == plaintexts
+    
+    assert PlayFairCipher6x6.encrypt_many(messages, key="alpha") == ciphertexts[0::3]
+    assert PlayFairCipher6x6.encrypt_many([]) == []
+    
+    print("  ✓ Passed")
+
+
+def test_key_fanout():
+    """Test encrypting one message under many keys on both backends."""
+    print("Testing multi-key fan-out...")
+    
+    rng = random.Random(15)
+    keys = ["K" + ''.join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789") for _ in range(8))
+            for _ in range(300)]
+    text = "Agent 007 in room 1100, door 33"
+    expected = [PlayFairCipher6x6(key).encrypt(text) for key in keys]
+    
+    numpy_module = vectorized.np
+    try:
+        for backend in (numpy_module, None):
+            vectorized.np = backend
+            assert list(PlayFairCipher6x6.encrypt_fanout(text, keys)) == expected
+            assert list(PlayFairCipher6x6.encrypt_fanout("", keys[:3])) == ["", "", ""]
+            assert list(PlayFairCipher6x6.encrypt_fanout(text, [])) == []
+    finally:
+        vectorized.np = numpy_module
+    
+    print("  ✓ Passed")
+
+
+def test_composed_cipher():
+    """Test fused multi-round encryption against chained rounds."""
+    print("Testing composed cipher...")
+    
+    rng = random.Random(16)
+    keys = ["MONARCHY", "PLAYFAIR", "KEY7"]
+    composed = PlayFairCipher6x6.compose(keys)
+    rounds = [PlayFairCipher6x6(key) for key in keys]
+    
+    texts = ["Hello World", "xx", "BOX X", ""]
+    texts += [''.join(rng.choice("AB0XXC9 x") for _ in range(rng.randint(0, 40))) for _ in range(300)]
+    for text in texts:
+        expected = text
+        for cipher in rounds:
+            expected = cipher.encrypt(expected)
+        assert composed.encrypt(text) == expected
+        
+        plaintext = expected
+        for cipher in reversed(rounds):
+            plaintext = cipher.decrypt(plaintext)
+        assert composed.decrypt(expected) == plaintext
+    
+    try:
+        ComposedCipher([])
+        assert False, "Should raise ValueError"
+    except ValueError:
+        pass
+    
+    print("  ✓ Passed")
+
+
+def test_rekey():
+    """Test direct re-keying of ciphertext and files."""
+    print("Testing re-keying...")
+    
+    old, new = PlayFairCipher6x6("OLDKEY"), PlayFairCipher6x6("NEWKEY")
+    text = "Agent 007, box XX in room 1100 x"
+    ciphertext = old.encrypt(text * 50)
+    
+    rekeyed = PlayFairCipher6x6.rekey(ciphertext, "OLDKEY", "NEWKEY")
+    assert len(rekeyed) == len(ciphertext)
+    assert new.decrypt(rekeyed) == old.decrypt(ciphertext)
+    assert PlayFairCipher6x6.rekey(ciphertext.lower() + " Q", "OLDKEY", "NEWKEY") == rekeyed
+    
+    with tempfile.TemporaryDirectory() as directory:
+        src = os.path.join(directory, "old.txt")
+        dst = os.path.join(directory, "new.txt")
+        with open(src, 'w') as f:
+            f.write(ciphertext[:101] + "\n" + ciphertext[101:])
+        
+        assert Rekeyer(old, new).rekey_file(src, dst, block_size=64) == len(rekeyed)
+        with open(dst) as f:
+            assert f.read() == rekeyed
+    
+    print("  ✓ Passed")
+
+
+def test_incremental_preparation():
+    """Test live re-encryption of only the digraphs an edit affects."""
+    print("Testing 6x6 incremental preparation...")
+    
+    cipher = PlayFairCipher6x6("CRYPTO2026")
+    rng = random.Random(7)
+    text = ''.join(rng.choice("AB12X. ") for _ in range(400))
+    live = LiveEncryption(cipher, text)
+    assert live.ciphertext == cipher.encrypt(text)
+    
+    for _ in range(300):
+        start = rng.randint(0, len(text))
+        stop = min(len(text), start + rng.randint(0, 5))
+        text = text[:start] + ''.join(rng.choice("AB12X. ") for _ in range(rng.randint(0, 5))) + text[stop:]
+        previous = live.ciphertext
+        begin, end, replacement = live.update(text)
+        assert previous[:begin] + replacement + previous[end:] == live.ciphertext
+        assert live.ciphertext == cipher.encrypt(text)
+        assert live.preparation.digraphs() == cipher._prepare_text(text)
+    
+    # Typing in the middle of a long text only touches nearby digraphs
+    preparation = IncrementalPreparation(cipher, text * 50)
+    begin, end, segment = preparation.update(text * 25 + "A" + text * 25)
+    assert end - begin < 100 and preparation.prepared == cipher._prepare(text * 25 + "A" + text * 25)
+    assert preparation.digraph_at(len(preparation.clean) - 1) == len(preparation.prepared) // 2 - 1
+    
+    print("  ✓ Passed")
+
+
 def run_all_tests():
     """Run all test functions."""
     print("\n" + "="*60)
@@ -303,6 +661,21 @@ def run_all_tests():
         test_special_characters_ignored,
         test_invalid_key,
         test_verbose_output,
+        test_digraph_tables,
+        test_vectorized_backend,
+        test_encryptor_streaming,
+        test_decryptor_streaming,
+        test_decrypt_file,
+        test_parallel_decrypt,
+        test_parallel_encrypt,
+        test_schedule_cache,
+        test_text_normalization,
+        test_compact_instances,
+        test_batch_api,
+        test_key_fanout,
+        test_composed_cipher,
+        test_rekey,
+        test_incremental_preparation,
     ]
     
     passed = 0